@@ -0,0 +1,47 @@
+"""Break-even point of the dense lookup tables of `MultiLocus`.
+
+For transcripts of various spans, the construction time of the dense lookup
+table is compared to the time it saves per lookup. The crossover is the
+number of lookups after which building the table pays off.
+"""
+import argparse
+import random
+
+from mutalyzer_crossmapper import MultiLocus
+
+from helper import locations, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-n', type=int, default=100000, help='number of lookups')
+    args = parser.parse_args()
+
+    random.seed(0)
+    print('span     exons  build (ms)  bisect (us)  dense (us)  crossover')
+
+    for span, exons in (
+            (10000, 5), (10000, 40), (100000, 10), (100000, 40),
+            (500000, 20), (500000, 40)):
+        exon_locations = locations(exons, span)
+        coordinates = [random.randrange(span) for _ in range(args.n)]
+
+        build, multi_locus = timed(MultiLocus, exon_locations, False, 1 << 30)
+        assert multi_locus._table
+        plain = MultiLocus(exon_locations)
+
+        dense_time, dense = timed(
+            lambda: list(map(multi_locus.to_position, coordinates)))
+        bisect_time, expected = timed(
+            lambda: list(map(plain.to_position, coordinates)))
+        assert dense == expected
+
+        saved = (bisect_time - dense_time) / args.n
+        print('{:7}  {:5}  {:10.1f}  {:11.2f}  {:10.2f}  {:9.0f}'.format(
+            span, exons, build * 1e3, bisect_time / args.n * 1e6,
+            dense_time / args.n * 1e6, build / saved))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import random
+from time import perf_counter
+
+
+def locations(exons, span):
+    """Make random non-overlapping exon locations.
+
+    :arg int exons: Number of exons.
+    :arg int span: Distance between the start of the first exon and the end
+        of the last exon.
+
+    :returns list: List of locations.
+    """
+    boundaries = sorted(random.sample(range(1, span - 1), 2 * exons - 2))
+    boundaries = [0] + boundaries + [span]
+
+    return list(zip(boundaries[::2], boundaries[1::2]))
+
+
+def timed(function, *args, repeat=3):
+    """Time a function call.
+
+    :arg function function: Function.
+    :arg list args: Arguments to {function}.
+    :arg int repeat: Number of repetitions.
+
+    :returns tuple: Fastest time in seconds and the result of the last call.
+    """
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function(*args)
+        times.append(perf_counter() - start)
+
+    return min(times), result
@@ -0,0 +1,77 @@
+"""Memory use of conversions into caller provided output buffers.
+
+The peak memory allocated during `Coding.coordinate_to_coding_into()` is
+compared with building a list of `coordinate_to_coding()` results. The
+output buffers are allocated before the measurement starts.
+"""
+import argparse
+import random
+import tracemalloc
+from array import array
+
+from mutalyzer_crossmapper import Coding
+
+from helper import locations, timed
+
+
+def _peak(function, *args):
+    """Measure the peak memory allocated by a function call.
+
+    :arg function function: Function.
+    :arg list args: Arguments to {function}.
+
+    :returns tuple: Peak allocation in bytes and the result of the call.
+    """
+    tracemalloc.start()
+    result = function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak, result
+
+
+def _convert(crossmap, coordinates):
+    """Convert coordinates to a list of coding positions.
+
+    :arg object crossmap: Coding object.
+    :arg list coordinates: Coordinates.
+
+    :returns list: Coding positions.
+    """
+    return [
+        crossmap.coordinate_to_coding(coordinate)
+        for coordinate in coordinates]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-n', type=int, nargs='+', default=[1000, 100000, 1000000],
+        help='batch sizes')
+    args = parser.parse_args()
+
+    random.seed(0)
+    exon_locations = locations(30, 20000)
+    crossmap = Coding(
+        exon_locations, (exon_locations[1][0], exon_locations[-2][1]))
+
+    print('batch size  _into (B)  list (B)   _into (s)  list (s)')
+    for size in args.n:
+        coordinates = array(
+            'l', (random.randrange(20000) for _ in range(size)))
+        buffers = [array('l', [0] * size) for _ in range(4)]
+
+        into_peak, _ = _peak(
+            crossmap.coordinate_to_coding_into, coordinates, *buffers)
+        list_peak, expected = _peak(_convert, crossmap, coordinates)
+        assert list(zip(*buffers)) == expected
+
+        into_time, _ = timed(
+            crossmap.coordinate_to_coding_into, coordinates, *buffers)
+        list_time, _ = timed(_convert, crossmap, coordinates)
+        print('{:10}  {:9}  {:9}  {:9.3f}  {:8.3f}'.format(
+            size, into_peak, list_peak, into_time, list_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Comparison of the batch conversion strategies of `MultiLocus`.
+
+For combinations of the number of exons, the batch size and the order of
+the batch, every applicable strategy is timed, together with the automatic
+choice (see `MultiLocus.strategy()`).
+"""
+import random
+
+from mutalyzer_crossmapper import MultiLocus
+
+from helper import locations, timed
+
+
+def main():
+    random.seed(0)
+    print('Times in ms.')
+    print('exons  n      order   bisect  sweep   sort    auto    chosen')
+
+    for exons, size, ordered in (
+            (10, 100, False), (10, 10000, True), (300, 10, False),
+            (300, 100, False), (300, 10000, False), (300, 10000, True)):
+        span = 200 * exons
+        multi_locus = MultiLocus(locations(exons, span))
+        coordinates = [random.randrange(span) for _ in range(size)]
+        if ordered:
+            coordinates.sort()
+        expected = list(map(multi_locus.to_position, coordinates))
+
+        times = []
+        for strategy in ('bisect', 'sweep', 'sort', None):
+            if strategy == 'sweep' and not ordered:
+                times.append('-')
+                continue
+            time, result = timed(
+                multi_locus.to_position_batch, coordinates, strategy,
+                repeat=5)
+            assert result == expected
+            times.append('{:.2f}'.format(time * 1e3))
+
+        print('{:5}  {:5}  {:6}  {:6}  {:6}  {:6}  {:6}  {}'.format(
+            exons, size, 'sorted' if ordered else 'random', *times,
+            multi_locus.strategy(coordinates)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Scaling of `thread_map()` with the number of worker threads.
+
+Run this benchmark on both a regular and a free threaded Python build, e.g.,
+`python3.13t benchmarks/threads.py`.
+"""
+import argparse
+import random
+import sys
+from os import cpu_count
+from time import perf_counter
+
+from mutalyzer_crossmapper import Coding, thread_map
+
+
+def _transcript(exons):
+    """Make a transcript with a given number of exons.
+
+    :arg int exons: Number of exons.
+
+    :returns object: Coding object.
+    """
+    locations = []
+    start = 0
+    for _ in range(exons):
+        start += random.randint(50, 500)
+        end = start + random.randint(50, 300)
+        locations.append((start, end))
+        start = end
+
+    return Coding(locations, (locations[1][0], locations[-2][1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-n', type=int, default=600000, help='number of coordinates')
+    parser.add_argument(
+        '-w', type=int, default=max(8, cpu_count() or 1),
+        help='maximum number of workers')
+    parser.add_argument(
+        '-r', type=int, default=3, help='number of repetitions')
+    args = parser.parse_args()
+
+    random.seed(0)
+    crossmap = _transcript(30)
+    span = crossmap._locations[-1][1]
+    coordinates = [random.randrange(span) for _ in range(args.n)]
+    expected = list(map(crossmap.coordinate_to_coding, coordinates))
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {}, GIL {}, {} CPUs'.format(
+        sys.version.split()[0], 'enabled' if gil else 'disabled',
+        cpu_count()))
+    print('workers  time (s)  speedup')
+
+    workers = 1
+    baseline = None
+    while workers <= args.w:
+        times = []
+        for _ in range(args.r):
+            start = perf_counter()
+            result = thread_map(
+                crossmap.coordinate_to_coding, coordinates, workers=workers)
+            times.append(perf_counter() - start)
+        assert result == expected
+
+        baseline = baseline or min(times)
+        print('{:7}  {:8.2f}  {:7.2f}'.format(
+            workers, min(times), baseline / min(times)))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
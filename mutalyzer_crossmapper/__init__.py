@@ -14,10 +14,17 @@ Definitions:
 """
 from pkg_resources import get_distribution
 
+from .cache import Cache
+from .catalogue import Catalogue
 from .crossmapper import Coding, Genomic, NonCoding
+from .editable import EditableCoding, EditableMultiLocus
+from .fasta import Fasta
+from .genome import Genome
+from .join import join
 from .location import nearest_location
 from .locus import Locus
 from .multi_locus import MultiLocus
+from .parallel import thread_map
 
 
 def _get_metadata(name):
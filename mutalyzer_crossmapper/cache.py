@@ -0,0 +1,187 @@
+import sqlite3
+from hashlib import sha1
+from weakref import WeakKeyDictionary
+
+from .editable import EditableCoding
+from .multi_locus import _pack
+
+
+def signature(crossmap):
+    """Calculate the signature of a transcript, consisting of the exons, the
+    CDS and the orientation.
+
+    :arg object crossmap: NonCoding or Coding object.
+
+    :returns str: Signature.
+    """
+    cds = getattr(crossmap, '_cds', None)
+
+    return sha1(repr((
+        _pack([tuple(map(int, location)) for location in crossmap._locations]),
+        tuple(map(int, cds)) if cds else None,
+        bool(crossmap._inverted))).encode()).hexdigest()
+
+
+def _serialise(value):
+    if isinstance(value, tuple):
+        return ','.join(map(str, value))
+    return str(value)
+
+
+def _deserialise(value):
+    if ',' in value:
+        return tuple(map(int, value.split(',')))
+    return int(value)
+
+
+class Cache(object):
+    """Persistent cache of conversion results.
+
+    Results are stored in an SQLite database and are identified by the
+    signature of the transcript, so they can be reused by other processes
+    and in later runs. EditableCoding objects are not supported, because
+    their contents change.
+    """
+    def __init__(self, path, size=0):
+        """
+        :arg str path: Path to the database.
+        :arg int size: Maximum number of results, the oldest results are
+            removed when this number is exceeded (0: unlimited).
+        """
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'signature TEXT, kind TEXT, key TEXT, value TEXT, '
+            'UNIQUE (signature, kind, key))')
+        self._signatures = WeakKeyDictionary()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute(
+            'SELECT count(*) FROM results').fetchone()[0]
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
+
+    def hit_rate(self):
+        """Calculate the fraction of lookups that were found in the cache.
+
+        :returns float: Hit rate.
+        """
+        if self.hits + self.misses:
+            return self.hits / (self.hits + self.misses)
+        return 0.0
+
+    def _signature(self, crossmap):
+        if isinstance(crossmap, EditableCoding):
+            raise TypeError('EditableCoding objects can not be cached')
+        if crossmap not in self._signatures:
+            self._signatures[crossmap] = signature(crossmap)
+        return self._signatures[crossmap]
+
+    def _lookup(self, crossmap, kind, keys, convert):
+        """Look up results and calculate and store the missing ones.
+
+        :arg object crossmap: NonCoding or Coding object.
+        :arg str kind: Kind of conversion.
+        :arg list keys: Arguments to the conversion function.
+        :arg function convert: Conversion function for a list of arguments.
+
+        :returns list: Results.
+        """
+        transcript = self._signature(crossmap)
+        serialised = list(map(_serialise, keys))
+
+        found = {}
+        unique = list(set(serialised))
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            found.update(self._connection.execute(
+                'SELECT key, value FROM results WHERE signature = ? AND '
+                'kind = ? AND key IN ({})'.format(','.join('?' * len(chunk))),
+                [transcript, kind] + chunk))
+
+        missing = {}
+        for key, value in zip(keys, serialised):
+            if value not in found and value not in missing:
+                missing[value] = key
+        self.misses += sum(value not in found for value in serialised)
+        self.hits += sum(value in found for value in serialised)
+
+        if missing:
+            results = convert(list(missing.values()))
+            rows = [
+                (transcript, kind, key, _serialise(result))
+                for key, result in zip(missing, results)]
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?)', rows)
+
+            if self.size and len(self) > self.size:
+                self._connection.execute(
+                    'DELETE FROM results WHERE rowid IN (SELECT rowid FROM '
+                    'results ORDER BY rowid LIMIT ?)',
+                    (len(self) - self.size, ))
+            self._connection.commit()
+
+            found.update(zip(missing, map(_serialise, results)))
+
+        return [_deserialise(found[value]) for value in serialised]
+
+    def coordinate_to_coding(self, crossmap, coordinate, degenerate=False):
+        """Convert a coordinate to a coding position (c./r.).
+
+        :arg object crossmap: Coding object.
+        :arg int coordinate: Coordinate.
+        :arg bool degenerate: Return a degenerate position.
+
+        :returns tuple: Coding position (c./r.).
+        """
+        return self.coordinate_to_coding_batch(
+            crossmap, [coordinate], degenerate)[0]
+
+    def coordinate_to_coding_batch(
+            self, crossmap, coordinates, degenerate=False):
+        """Convert coordinates to coding positions (c./r.).
+
+        :arg object crossmap: Coding object.
+        :arg list coordinates: Coordinates.
+        :arg bool degenerate: Return degenerate positions.
+
+        :returns list: Coding positions (c./r.).
+        """
+        return self._lookup(
+            crossmap, 'cd' if degenerate else 'c', coordinates,
+            lambda keys: crossmap.coordinate_to_coding_batch(
+                keys, degenerate))
+
+    def coding_to_coordinate(self, crossmap, position):
+        """Convert a coding position (c./r.) to a coordinate.
+
+        :arg object crossmap: Coding object.
+        :arg tuple position: Coding position (c./r.).
+
+        :returns int: Coordinate.
+        """
+        return self.coding_to_coordinate_batch(crossmap, [position])[0]
+
+    def coding_to_coordinate_batch(self, crossmap, positions):
+        """Convert coding positions (c./r.) to coordinates.
+
+        :arg object crossmap: Coding object.
+        :arg list positions: Coding positions (c./r.).
+
+        :returns list: Coordinates.
+        """
+        return self._lookup(
+            crossmap, 'g', [tuple(position[:3]) for position in positions],
+            lambda keys: list(map(crossmap.coding_to_coordinate, keys)))
@@ -0,0 +1,275 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+from .crossmapper import Coding, NonCoding
+
+
+class Catalogue(object):
+    """Catalogue object, a packed table of many transcripts."""
+    def __init__(self, exons, index, cds=None, inverted=None):
+        """
+        :arg list exons: Concatenated exon lists of all transcripts.
+        :arg list index: Index of the first exon of every transcript in
+            {exons}, followed by the total number of exons.
+        :arg list cds: Per transcript CDS location, None for noncoding
+            transcripts.
+        :arg list inverted: Per transcript orientation.
+        """
+        size = len(index) - 1
+
+        self._index = tuple(index)
+        self._inverted = tuple(inverted or [False] * size)
+
+        self._boundaries = []
+        self._offsets = []
+        for transcript in range(size):
+            locations = exons[index[transcript]:index[transcript + 1]]
+            lengths = [location[1] - location[0] for location in locations]
+            length = sum(lengths)
+
+            offset = 0
+            for location, locus_length in zip(locations, lengths):
+                self._boundaries.extend(location)
+                if self._inverted[transcript]:
+                    self._offsets.append(length - offset - locus_length)
+                else:
+                    self._offsets.append(offset)
+                offset += locus_length
+
+        self._set_cds(cds or [None] * size)
+
+    @classmethod
+    def from_arrays(cls, starts, ends, index, cds_starts, cds_ends, strands):
+        """Construct a catalogue from columnar data, e.g., NumPy arrays.
+
+        :arg list starts: Concatenated exon starts of all transcripts.
+        :arg list ends: Concatenated exon ends of all transcripts.
+        :arg list index: Index of the first exon of every transcript in
+            {starts}, followed by the total number of exons.
+        :arg list cds_starts: Per transcript CDS start.
+        :arg list cds_ends: Per transcript CDS end, transcripts for which the
+            CDS end does not exceed the CDS start are noncoding.
+        :arg list strands: Per transcript strand, either `+`/`-` or 1/-1.
+
+        :returns object: Catalogue object.
+        """
+        catalogue = cls.__new__(cls)
+        size = len(index) - 1
+
+        catalogue._index = tuple(map(int, index))
+        catalogue._inverted = tuple(strand in ('-', -1) for strand in strands)
+
+        boundaries = [0] * (2 * len(starts))
+        boundaries[0::2] = map(int, starts)
+        boundaries[1::2] = map(int, ends)
+        catalogue._boundaries = boundaries
+
+        lengths = [end - start for start, end in zip(
+            boundaries[0::2], boundaries[1::2])]
+        catalogue._offsets = offsets = [0] * len(lengths)
+        for transcript in range(size):
+            first = catalogue._index[transcript]
+            last = catalogue._index[transcript + 1]
+            exon_lengths = lengths[first:last]
+            total = sum(exon_lengths)
+
+            if catalogue._inverted[transcript]:
+                offsets[first:last] = [
+                    total - cumulative
+                    for cumulative in accumulate(exon_lengths)]
+            else:
+                offsets[first:last] = [
+                    cumulative - length for cumulative, length in zip(
+                        accumulate(exon_lengths), exon_lengths)]
+
+        catalogue._set_cds([
+            (int(start), int(end)) if start < end else None
+            for start, end in zip(cds_starts, cds_ends)])
+
+        return catalogue
+
+    def _set_cds(self, cds):
+        """Calculate the CDS boundaries in transcript positions.
+
+        :arg list cds: Per transcript CDS location, None for noncoding
+            transcripts.
+        """
+        self._cds = list(cds)
+        self._coding = [None] * len(self)
+        self._cds_len = [None] * len(self)
+
+        for transcript, location in enumerate(self._cds):
+            if location:
+                b0 = self._to_position(transcript, location[0])
+                b1 = self._to_position(transcript, location[1])
+
+                if self._inverted[transcript]:
+                    self._coding[transcript] = (
+                        b1[0] + b1[1] + 1, b0[0] + b0[1] + 1)
+                    self._cds_len[transcript] = (
+                        (b0[0] + b0[1]) - (b1[0] + b1[1]))
+                else:
+                    self._coding[transcript] = (
+                        b0[0] + b0[1], b1[0] + b1[1])
+                    self._cds_len[transcript] = (
+                        (b1[0] + b1[1]) - (b0[0] + b0[1]))
+
+    def __len__(self):
+        return len(self._index) - 1
+
+    def crossmap(self, transcript, dense=0, lazy=False, intern=False):
+        """Construct a crossmap object for a single transcript.
+
+        :arg int transcript: Transcript index.
+        :arg int dense: Memory ceiling in bytes for a dense lookup table
+            (0: disabled).
+        :arg bool lazy: Postpone the construction of internal structures
+            until the first conversion.
+        :arg bool intern: Share internal structures with other objects that
+            have the same locations.
+
+        :returns object: Coding object, or NonCoding object for noncoding
+            transcripts.
+        """
+        boundaries = self._boundaries[
+            2 * self._index[transcript]:2 * self._index[transcript + 1]]
+        locations = list(zip(boundaries[0::2], boundaries[1::2]))
+        inverted = self._inverted[transcript]
+
+        if self._cds[transcript]:
+            return Coding(
+                locations, self._cds[transcript], inverted, dense, lazy,
+                intern)
+        return NonCoding(locations, inverted, dense, lazy, intern)
+
+    def _to_position(self, transcript, coordinate):
+        """Convert a coordinate to a position.
+
+        :arg int transcript: Transcript index.
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Position.
+        """
+        boundaries = self._boundaries
+        inverted = self._inverted[transcript]
+        lb = 2 * self._index[transcript]
+        rb = 2 * self._index[transcript + 1]
+
+        i = bisect_right(boundaries, coordinate, lb, rb)
+        if (i - lb) % 2:       # `coordinate` lies in a location.
+            i -= 1
+        elif i == lb:          # `coordinate` lies upstream.
+            pass
+        elif i == rb:          # `coordinate` lies downstream.
+            i -= 2
+        elif coordinate < (
+                boundaries[i - 1] + boundaries[i] + 1 - inverted) // 2:
+            i -= 2             # `coordinate` is nearest to the left.
+
+        start = boundaries[i]
+        end = boundaries[i + 1] - 1
+        offset = self._offsets[i // 2]
+
+        if inverted:
+            outside = 0
+            if coordinate < boundaries[lb]:
+                outside = boundaries[lb] - coordinate
+            elif coordinate >= boundaries[rb - 1]:
+                outside = boundaries[rb - 1] - 1 - coordinate
+
+            if coordinate > end:
+                return offset, end - coordinate, outside
+            if coordinate < start:
+                return offset + end - start, start - coordinate, outside
+            return offset + end - coordinate, 0, outside
+
+        outside = 0
+        if coordinate < boundaries[lb]:
+            outside = coordinate - boundaries[lb]
+        elif coordinate >= boundaries[rb - 1]:
+            outside = coordinate - boundaries[rb - 1] + 1
+
+        if coordinate < start:
+            return offset, coordinate - start, outside
+        if coordinate > end:
+            return offset + end - start, coordinate - end, outside
+        return offset + coordinate - start, 0, outside
+
+    def coordinate_to_noncoding(self, transcripts, coordinates):
+        """Convert coordinates to noncoding positions (n./r.).
+
+        :arg list transcripts: Transcript indices.
+        :arg list coordinates: Coordinates.
+
+        :returns list: Noncoding positions.
+        """
+        result = []
+
+        for transcript, coordinate in zip(transcripts, coordinates):
+            pos = self._to_position(transcript, coordinate)
+            result.append((pos[0] + 1, pos[1], pos[2]))
+
+        return result
+
+    def coordinate_to_coding(self, transcripts, coordinates, degenerate=False):
+        """Convert coordinates to coding positions (c./r.).
+
+        :arg list transcripts: Transcript indices.
+        :arg list coordinates: Coordinates.
+        :arg bool degenerate: Return degenerate positions.
+
+        :returns list: Coding positions (c./r.).
+
+        :raises ValueError: If a transcript is noncoding.
+        """
+        result = []
+
+        for transcript, coordinate in zip(transcripts, coordinates):
+            coding = self._coding[transcript]
+            if coding is None:
+                raise ValueError(
+                    'transcript {} is noncoding'.format(transcript))
+
+            pos = self._to_position(transcript, coordinate)
+
+            if pos[0] < coding[0]:
+                pos = pos[0] - coding[0], pos[1], -1, pos[2]
+            elif pos[0] >= coding[1]:
+                pos = pos[0] - coding[1] + 1, pos[1], 1, pos[2]
+            else:
+                pos = pos[0] - coding[0] + 1, pos[1], 0, pos[2]
+
+            if degenerate and pos[3]:
+                cds_len = self._cds_len[transcript]
+
+                if pos[2] == 0 and pos[0] == 1 and pos[1] < 0:
+                    pos = pos[1], 0, -1, pos[3]
+                elif pos[2] == 0 and pos[0] == cds_len and pos[1] > 0:
+                    pos = pos[0] + pos[1] - cds_len, 0, 1, pos[3]
+                else:
+                    pos = pos[0] + pos[1], 0, pos[2], pos[3]
+
+            result.append(pos)
+
+        return result
+
+    def coordinate_to_protein(self, transcripts, coordinates):
+        """Convert coordinates to protein positions (p.).
+
+        :arg list transcripts: Transcript indices.
+        :arg list coordinates: Coordinates.
+
+        :returns list: Protein positions (p.).
+
+        :raises ValueError: If a transcript is noncoding.
+        """
+        result = []
+
+        for pos in self.coordinate_to_coding(transcripts, coordinates):
+            if pos[2] == -1:
+                result.append((pos[0] // 3, pos[0] % 3 + 1, *pos[1:]))
+            else:
+                result.append(
+                    ((pos[0] + 2) // 3, (pos[0] + 2) % 3 + 1, *pos[1:]))
+
+        return result
@@ -1,4 +1,4 @@
-from .multi_locus import MultiLocus
+from .multi_locus import MultiLocus, _pack, _unpack, interned
 
 
 class Genomic(object):
@@ -24,14 +24,49 @@ class Genomic(object):
 
 class NonCoding(Genomic):
     """NonCoding crossmap object."""
-    def __init__(self, locations, inverted=False):
+    _lazy = ('_noncoding', )
+
+    def __init__(
+            self, locations, inverted=False, dense=0, lazy=False,
+            intern=False):
         """
         :arg list locations: List of locus locations.
         :arg bool inverted: Orientation.
+        :arg int dense: Memory ceiling in bytes for a dense lookup table
+            (0: disabled).
+        :arg bool lazy: Postpone the construction of internal structures
+            until the first conversion.
+        :arg bool intern: Share internal structures with other objects that
+            have the same locations.
         """
+        self._locations = tuple(locations)
         self._inverted = inverted
-
-        self._noncoding = MultiLocus(locations, inverted)
+        self._dense = dense
+        self._intern = intern
+
+        if not lazy:
+            self._build()
+
+    def __reduce__(self):
+        return _unpack, (
+            type(self), _pack(self._locations), self._inverted, self._dense,
+            '_noncoding' not in self.__dict__, self._intern)
+
+    def __getattr__(self, name):
+        if name in self._lazy:
+            self._build()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def _build(self):
+        """Construct the internal structures."""
+        if self._intern:
+            self._noncoding = interned(
+                self._locations, self._inverted, self._dense)
+            self._locations = self._noncoding._locations
+        else:
+            self._noncoding = MultiLocus(
+                self._locations, self._inverted, self._dense)
 
     def coordinate_to_noncoding(self, coordinate):
         """Convert a coordinate to a noncoding position (n./r.).
@@ -44,6 +79,182 @@ class NonCoding(Genomic):
 
         return pos[0] + 1, pos[1], pos[2]
 
+    def coordinate_to_noncoding_batch(self, coordinates, strategy=None):
+        """Convert coordinates to noncoding positions (n./r.).
+
+        :arg list coordinates: Coordinates.
+        :arg str strategy: Conversion strategy, chosen automatically by
+            default (see `strategy()`).
+
+        :returns list: Noncoding positions.
+        """
+        return [
+            (pos[0] + 1, pos[1], pos[2]) for pos in
+            self._noncoding.to_position_batch(coordinates, strategy)]
+
+    def strategy(self, coordinates):
+        """Choose the fastest strategy to convert a batch of coordinates.
+
+        :arg list coordinates: Coordinates.
+
+        :returns str: Name of the strategy, one of `dense`, `bisect`, `sweep`
+            or `sort`.
+        """
+        return self._noncoding.strategy(coordinates)
+
+    def coordinate_to_noncoding_into(
+            self, coordinates, positions, offsets, outsides):
+        """Convert coordinates to noncoding positions (n./r.), the elements
+        of the positions are written to the output buffers.
+
+        :arg list coordinates: Coordinates.
+        :arg list positions: Output buffer for the transcript positions.
+        :arg list offsets: Output buffer for the offsets.
+        :arg list outsides: Output buffer for the upstream or downstream
+            offsets.
+        """
+        self._noncoding.to_position_into(
+            coordinates, positions, offsets, outsides)
+
+        for i in range(len(coordinates)):
+            positions[i] += 1
+
+    def coordinate_to_noncoding_runs(self, location):
+        """Convert a location to runs of noncoding positions (n./r.).
+        Within a run, either the transcript position (in an exon) or the
+        offset (outside an exon) changes by one for every next coordinate,
+        it increases for forward oriented transcripts and it decreases
+        otherwise. In runs upstream or downstream of the transcript, the
+        upstream or downstream offset changes along with the offset.
+
+        :arg tuple location: Location.
+
+        :returns list: List of runs, each a 3-tuple of the first
+            coordinate, the length and the noncoding position of the first
+            coordinate.
+        """
+        return [
+            (coordinate, size, (pos[0] + 1, pos[1], pos[2]))
+            for coordinate, size, pos in
+            self._noncoding.to_position_runs(location)]
+
+    def project_coverage(self, start, coverage):
+        """Project per coordinate values onto the transcript.
+
+        :arg int start: Coordinate of the first value.
+        :arg list coverage: Values, e.g., the read depth, for consecutive
+            coordinates.
+
+        :returns list: Values for all transcript positions, in transcript
+            order. Positions without a value are set to 0.
+        """
+        result = [0] * len(self._noncoding)
+
+        for coordinate, size, pos in self._noncoding.to_position_runs(
+                (start, start + len(coverage))):
+            if not pos[1]:
+                values = coverage[coordinate - start:coordinate - start + size]
+                if self._inverted:
+                    result[pos[0] - size + 1:pos[0] + 1] = values[::-1]
+                else:
+                    result[pos[0]:pos[0] + size] = values
+
+        return result
+
+    def _blocks(self, reads):
+        """Convert the first and last coordinates of aligned read blocks to
+        positions and check the junctions between the blocks.
+
+        :arg list reads: List of reads, each a list of block locations in
+            genomic order.
+
+        :returns tuple: List of positions of the first and last coordinates
+            of all blocks and a list of junction concordance flags.
+        """
+        introns = set(zip(
+            (location[1] for location in self._noncoding._locations[:-1]),
+            (location[0] for location in self._noncoding._locations[1:])))
+
+        coordinates = []
+        concordant = []
+        for blocks in reads:
+            for block in blocks:
+                coordinates.append(block[0])
+                coordinates.append(block[1] - 1)
+            concordant.append(all(
+                (left[1], right[0]) in introns
+                for left, right in zip(blocks, blocks[1:])
+                if left[1] < right[0]))
+
+        return (
+            self._noncoding.to_position_batch(coordinates, 'sort'),
+            concordant)
+
+    def blocks_to_noncoding(self, reads):
+        """Convert aligned read blocks to noncoding positions (n./r.).
+
+        A gap between two blocks is a junction, it is concordant if it is
+        equal to an intron.
+
+        :arg list reads: List of reads, each a list of block locations in
+            genomic order.
+
+        :returns list: List of 2-tuples, one for every read, of a list of
+            blocks and a flag that is True if all junctions are concordant.
+            A block is a 2-tuple of the noncoding positions of the first and
+            the last coordinate.
+        """
+        positions, concordant = self._blocks(reads)
+        positions = iter([
+            (pos[0] + 1, pos[1], pos[2]) for pos in positions])
+
+        return [
+            ([(next(positions), next(positions)) for _ in blocks], flag)
+            for blocks, flag in zip(reads, concordant)]
+
+    def _annotate(self, coordinate):
+        """Convert a coordinate to a position and find the exon or intron
+        number, the distance to the nearest splice site and the feature.
+
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Position, exon or intron number, splice site
+            distance and feature.
+        """
+        pos, locus, distance = self._noncoding.annotate(coordinate)
+
+        if pos[2] < 0:
+            return pos, None, distance, 'upstream'
+        if pos[2] > 0:
+            return pos, None, distance, 'downstream'
+        if pos[1] < 0:
+            return pos, locus, distance, 'intron'
+        if pos[1] > 0:
+            return pos, locus + 1, distance, 'intron'
+        return pos, locus + 1, distance, 'exon'
+
+    def annotate(self, coordinate):
+        """Convert a coordinate to a noncoding position (n./r.) and annotate
+        it.
+
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Noncoding position, exon or intron number, splice
+            site distance and feature.
+        """
+        pos, number, distance, feature = self._annotate(coordinate)
+
+        return pos[0] + 1, pos[1], pos[2], number, distance, feature
+
+    def annotate_batch(self, coordinates):
+        """Convert coordinates to annotated positions.
+
+        :arg list coordinates: Coordinates.
+
+        :returns list: Annotated positions.
+        """
+        return list(map(self.annotate, coordinates))
+
     def noncoding_to_coordinate(self, position):
         """Convert a noncoding position (n./r.) to a coordinate.
 
@@ -59,14 +270,41 @@ class NonCoding(Genomic):
 
 class Coding(NonCoding):
     """Coding crossmap object."""
-    def __init__(self, locations, cds, inverted=False):
+    _lazy = ('_noncoding', '_coding', '_cds_len')
+
+    def __init__(
+            self, locations, cds, inverted=False, dense=0, lazy=False,
+            intern=False):
         """
         :arg list locations: List of locus locations.
         :arg tuple cds: Locus location.
         :arg bool inverted: Orientation.
+        :arg int dense: Memory ceiling in bytes for a dense lookup table
+            (0: disabled).
+        :arg bool lazy: Postpone the construction of internal structures
+            until the first conversion.
+        :arg bool intern: Share internal structures with other objects that
+            have the same locations.
         """
-        NonCoding.__init__(self, locations, inverted)
+        self._cds = tuple(cds)
+
+        NonCoding.__init__(self, locations, inverted, dense, lazy, intern)
+
+    def __reduce__(self):
+        return _unpack, (
+            type(self), _pack(self._locations), self._cds, self._inverted,
+            self._dense, '_noncoding' not in self.__dict__, self._intern)
+
+    def _build(self):
+        """Construct the internal structures."""
+        NonCoding._build(self)
+        self._set_cds(self._cds)
+
+    def _set_cds(self, cds):
+        """Calculate the CDS boundaries in transcript positions.
 
+        :arg tuple cds: Locus location.
+        """
         b0 = self._noncoding.to_position(cds[0])
         b1 = self._noncoding.to_position(cds[1])
 
@@ -84,8 +322,16 @@ class Coding(NonCoding):
 
         :returns tuple: Coding position (c./r.).
         """
-        pos = self._noncoding.to_position(coordinate)
+        return self._position_to_coding(
+            self._noncoding.to_position(coordinate))
+
+    def _position_to_coding(self, pos):
+        """Convert a transcript position to a coding position (c./r.).
+
+        :arg tuple pos: Transcript position.
 
+        :returns tuple: Coding position (c./r.).
+        """
         if pos[0] < self._coding[0]:
             return pos[0] - self._coding[0], pos[1], -1, pos[2]
         elif pos[0] >= self._coding[1]:
@@ -103,15 +349,132 @@ class Coding(NonCoding):
         pos = self._coordinate_to_coding(coordinate)
 
         if degenerate and pos[3]:
-            if pos[2] == 0:
-                if pos[0] == 1 and pos[1] < 0:
-                    return pos[1], 0, -1, pos[3]
-                if pos[0] == self._cds_len and pos[1] > 0:
-                    return pos[0] + pos[1] - self._cds_len, 0, 1, pos[3]
-            return pos[0] + pos[1], 0, pos[2], pos[3]
+            return self._degenerate(pos)
 
         return pos
 
+    def _degenerate(self, pos):
+        """Convert a coding position (c./r.) outside of the transcript to a
+        degenerate position.
+
+        :arg tuple pos: Coding position (c./r.).
+
+        :returns tuple: Degenerate coding position (c./r.).
+        """
+        if pos[2] == 0:
+            if pos[0] == 1 and pos[1] < 0:
+                return pos[1], 0, -1, pos[3]
+            if pos[0] == self._cds_len and pos[1] > 0:
+                return pos[0] + pos[1] - self._cds_len, 0, 1, pos[3]
+        return pos[0] + pos[1], 0, pos[2], pos[3]
+
+    def coordinate_to_coding_batch(
+            self, coordinates, degenerate=False, strategy=None):
+        """Convert coordinates to coding positions (c./r.).
+
+        :arg list coordinates: Coordinates.
+        :arg bool degenerate: Return degenerate positions.
+        :arg str strategy: Conversion strategy, chosen automatically by
+            default (see `strategy()`).
+
+        :returns list: Coding positions (c./r.).
+        """
+        positions = map(
+            self._position_to_coding,
+            self._noncoding.to_position_batch(coordinates, strategy))
+
+        if degenerate:
+            return [
+                self._degenerate(pos) if pos[3] else pos for pos in positions]
+        return list(positions)
+
+    def coordinate_to_coding_into(
+            self, coordinates, positions, offsets, regions, outsides,
+            degenerate=False):
+        """Convert coordinates to coding positions (c./r.), the elements of
+        the positions are written to the output buffers.
+
+        :arg list coordinates: Coordinates.
+        :arg list positions: Output buffer for the transcript positions.
+        :arg list offsets: Output buffer for the offsets.
+        :arg list regions: Output buffer for the regions.
+        :arg list outsides: Output buffer for the upstream or downstream
+            offsets.
+        :arg bool degenerate: Return degenerate positions.
+        """
+        self._noncoding.to_position_into(
+            coordinates, positions, offsets, outsides)
+
+        coding_start, coding_end = self._coding
+        cds_len = self._cds_len
+
+        for i in range(len(coordinates)):
+            position = positions[i]
+
+            if position < coding_start:
+                position -= coding_start
+                region = -1
+            elif position >= coding_end:
+                position -= coding_end - 1
+                region = 1
+            else:
+                position -= coding_start - 1
+                region = 0
+
+            if degenerate and outsides[i]:
+                offset = offsets[i]
+                offsets[i] = 0
+
+                if region == 0 and position == 1 and offset < 0:
+                    position = offset
+                    region = -1
+                elif region == 0 and position == cds_len and offset > 0:
+                    position += offset - cds_len
+                    region = 1
+                else:
+                    position += offset
+
+            positions[i] = position
+            regions[i] = region
+
+    def annotate(self, coordinate):
+        """Convert a coordinate to a coding position (c./r.) and annotate
+        it.
+
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Coding position (c./r.), exon or intron number,
+            splice site distance and feature.
+        """
+        pos, number, distance, feature = self._annotate(coordinate)
+        pos = self._position_to_coding(pos)
+
+        if feature == 'exon':
+            feature = ('utr5', 'cds', 'utr3')[pos[2] + 1]
+
+        return (*pos, number, distance, feature)
+
+    def blocks_to_coding(self, reads):
+        """Convert aligned read blocks to coding positions (c./r.).
+
+        A gap between two blocks is a junction, it is concordant if it is
+        equal to an intron.
+
+        :arg list reads: List of reads, each a list of block locations in
+            genomic order.
+
+        :returns list: List of 2-tuples, one for every read, of a list of
+            blocks and a flag that is True if all junctions are concordant.
+            A block is a 2-tuple of the coding positions of the first and
+            the last coordinate.
+        """
+        positions, concordant = self._blocks(reads)
+        positions = iter(map(self._position_to_coding, positions))
+
+        return [
+            ([(next(positions), next(positions)) for _ in blocks], flag)
+            for blocks, flag in zip(reads, concordant)]
+
     def coding_to_coordinate(self, position):
         """Convert a coding position (c./r.) to a coordinate.
 
@@ -154,3 +517,30 @@ class Coding(NonCoding):
 
         return self.coding_to_coordinate(
             (3 * position[0] + position[1] - 3, *position[2:]))
+
+    def protein_to_locations(self, first, last):
+        """Convert a protein range (p.) to the locations of the nucleotides
+        that encode it.
+
+        :arg int first: First protein position of the range (p.).
+        :arg int last: Last protein position of the range (p.).
+
+        :returns list: List of locations, in transcript order.
+        """
+        start = self.coding_to_coordinate((3 * first - 2, 0, 0))
+        end = self.coding_to_coordinate((3 * last, 0, 0))
+
+        if self._inverted:
+            return self._noncoding.intersection((end, start + 1))[::-1]
+        return self._noncoding.intersection((start, end + 1))
+
+    def protein_to_locations_batch(self, ranges):
+        """Convert protein ranges (p.) to the locations of the nucleotides
+        that encode them.
+
+        :arg list ranges: List of protein ranges (p.), each a 2-tuple of the
+            first and last protein position.
+
+        :returns list: List of lists of locations, in transcript order.
+        """
+        return [self.protein_to_locations(*range_) for range_ in ranges]
@@ -0,0 +1,235 @@
+from bisect import bisect_left
+
+from .crossmapper import Coding
+from .location import nearest_location
+from .locus import Locus
+from .multi_locus import MultiLocus, _pack, _unpack
+
+
+class _FenwickTree(object):
+    """Fenwick tree (binary indexed tree) of non-negative integers."""
+    def __init__(self, values):
+        """
+        :arg list values: List of non-negative integers.
+        """
+        self._tree = [0] + list(values)
+
+        for i in range(1, len(self._tree)):
+            j = i + (i & -i)
+            if j < len(self._tree):
+                self._tree[j] += self._tree[i]
+
+    def add(self, index, value):
+        """Add a value to an element.
+
+        :arg int index: Index of the element.
+        :arg int value: Value to add.
+        """
+        index += 1
+
+        while index < len(self._tree):
+            self._tree[index] += value
+            index += index & -index
+
+    def prefix(self, index):
+        """Calculate the sum of the elements preceding `index`.
+
+        :arg int index: Index.
+
+        :returns int: Sum of the first `index` elements.
+        """
+        total = 0
+
+        while index:
+            total += self._tree[index]
+            index -= index & -index
+
+        return total
+
+    def search(self, value):
+        """Find the largest index for which the prefix sum does not exceed
+        `value`.
+
+        :arg int value: Value.
+
+        :returns int: Index, -1 if `value` is negative.
+        """
+        if value < 0:
+            return -1
+
+        index = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+
+        while step:
+            if (index + step < len(self._tree) and
+                    self._tree[index + step] <= value):
+                index += step
+                value -= self._tree[index]
+            step >>= 1
+
+        return index
+
+
+class EditableMultiLocus(MultiLocus):
+    """MultiLocus object that allows for the insertion, removal and resizing
+    of loci.
+    """
+    def __init__(self, locations, inverted=False):
+        """
+        :arg list locations: List of locus locations.
+        :arg bool inverted: Orientation.
+        """
+        self._locations = list(locations)
+        self._inverted = inverted
+
+        self._loci = [Locus(location, inverted) for location in locations]
+        self._orientation = -1 if inverted else 1
+        self._table = None
+        lengths = [location[1] - location[0] for location in locations]
+        self._lengths = _FenwickTree(lengths)
+        self._length = sum(lengths)
+
+    def __reduce__(self):
+        return _unpack, (
+            type(self), _pack(self._locations), self._inverted)
+
+    def _offset(self, index):
+        """Calculate the length of the loci preceding a locus in transcript
+        orientation.
+
+        :arg int index: Index of the locus.
+
+        :returns int: Cumulative locus length.
+        """
+        if self._inverted:
+            return self._length - self._lengths.prefix(index + 1)
+        return self._lengths.prefix(index)
+
+    def insert_locus(self, location):
+        """Insert a locus.
+
+        :arg tuple location: Locus location, this location may not overlap
+            with any of the existing locations.
+
+        :returns int: Index of the new locus.
+        """
+        index = bisect_left(self._locations, location)
+
+        self._locations.insert(index, location)
+        self._loci.insert(index, Locus(location, self._inverted))
+        self._lengths = _FenwickTree(
+            other[1] - other[0] for other in self._locations)
+        self._length += location[1] - location[0]
+
+        return index
+
+    def remove_locus(self, index):
+        """Remove a locus.
+
+        :arg int index: Index of the locus.
+        """
+        location = self._locations.pop(index)
+
+        self._loci.pop(index)
+        self._lengths = _FenwickTree(
+            other[1] - other[0] for other in self._locations)
+        self._length -= location[1] - location[0]
+
+    def resize_locus(self, index, location):
+        """Change the boundaries of a locus.
+
+        :arg int index: Index of the locus.
+        :arg tuple location: New locus location, this location may not
+            overlap with any of the other locations.
+        """
+        difference = (
+            (location[1] - location[0]) -
+            (self._locations[index][1] - self._locations[index][0]))
+
+        self._locations[index] = location
+        self._loci[index] = Locus(location, self._inverted)
+        self._lengths.add(index, difference)
+        self._length += difference
+
+    def to_position(self, coordinate):
+        """Convert a coordinate to a position.
+
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Position.
+        """
+        return self._to_position(
+            nearest_location(self._locations, coordinate, self._inverted),
+            coordinate)
+
+    def to_coordinate(self, position):
+        """Convert a position to a coordinate.
+
+        :arg int position: Position.
+
+        :returns int: Coordinate.
+        """
+        if self._inverted:
+            index = min(
+                len(self._loci) - 1,
+                max(0, self._lengths.search(self._length - position[0] - 1)))
+        else:
+            index = min(
+                len(self._loci) - 1, max(0, self._lengths.search(position[0])))
+
+        return self._loci[index].to_coordinate(
+            (position[0] - self._offset(index), position[1]))
+
+
+class EditableCoding(Coding):
+    """Coding crossmap object that allows for the insertion, removal and
+    resizing of exons.
+    """
+    def __init__(self, locations, cds, inverted=False):
+        """
+        :arg list locations: List of locus locations.
+        :arg tuple cds: Locus location.
+        :arg bool inverted: Orientation.
+        """
+        self._inverted = inverted
+        self._cds = tuple(cds)
+
+        self._noncoding = EditableMultiLocus(locations, inverted)
+        self._locations = self._noncoding._locations
+        self._set_cds(cds)
+
+    def __reduce__(self):
+        return _unpack, (
+            type(self), _pack(self._noncoding._locations), self._cds,
+            self._inverted)
+
+    def insert_exon(self, location):
+        """Insert an exon.
+
+        :arg tuple location: Exon location, this location may not overlap
+            with any of the existing exons.
+
+        :returns int: Index of the new exon.
+        """
+        index = self._noncoding.insert_locus(location)
+        self._set_cds(self._cds)
+
+        return index
+
+    def remove_exon(self, index):
+        """Remove an exon.
+
+        :arg int index: Index of the exon.
+        """
+        self._noncoding.remove_locus(index)
+        self._set_cds(self._cds)
+
+    def resize_exon(self, index, location):
+        """Change the boundaries of an exon.
+
+        :arg int index: Index of the exon.
+        :arg tuple location: New exon location, this location may not
+            overlap with any of the other exons.
+        """
+        self._noncoding.resize_locus(index, location)
+        self._set_cds(self._cds)
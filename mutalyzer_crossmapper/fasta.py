@@ -0,0 +1,168 @@
+from mmap import ACCESS_READ, mmap
+
+
+_complement = bytes.maketrans(
+    b'ACGTURYKMBVDHNacgturykmbvdhn', b'TGCAAYRMKVBHDNtgcaayrmkvbhdn')
+
+
+def reverse_complement(sequence):
+    """Reverse complement a nucleotide sequence.
+
+    :arg bytes sequence: Nucleotide sequence.
+
+    :returns bytes: Reverse complement of {sequence}.
+    """
+    return sequence.translate(_complement)[::-1]
+
+
+class Fasta(object):
+    """Indexed FASTA file reader.
+
+    The FASTA file is memory mapped, only the requested parts are read.
+    """
+    def __init__(self, path, index=None):
+        """
+        :arg str path: Path to a FASTA file.
+        :arg str index: Path to the FASTA index (.fai), defaults to `path`
+            followed by `.fai`.
+        """
+        self._index = {}
+        with open(index or '{}.fai'.format(path)) as handle:
+            for line in handle:
+                fields = line.split('\t')
+                self._index[fields[0]] = tuple(map(int, fields[1:5]))
+
+        with open(path, 'rb') as handle:
+            self._map = mmap(handle.fileno(), 0, access=ACCESS_READ)
+        self._view = memoryview(self._map)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the FASTA file."""
+        self._view.release()
+        self._map.close()
+
+    def fetch(self, contig, start, end):
+        """Get the sequence of a location on a contig.
+
+        :arg str contig: Contig name.
+        :arg int start: Start of the location.
+        :arg int end: End of the location.
+
+        :returns bytes: Sequence.
+        """
+        length, offset, line_bases, line_width = self._index[contig]
+        start = max(0, start)
+        end = min(length, end)
+
+        pieces = []
+        while start < end:
+            line_end = min(end, (start // line_bases + 1) * line_bases)
+            position = (
+                offset + start // line_bases * line_width +
+                start % line_bases)
+            pieces.append(self._view[position:position + line_end - start])
+            start = line_end
+
+        return b''.join(pieces)
+
+    def _join(self, contig, locations, inverted):
+        """Get the concatenated sequence of a list of locations.
+
+        :arg str contig: Contig name.
+        :arg list locations: List of locations, in genomic order.
+        :arg bool inverted: Orientation.
+
+        :returns bytes: Sequence.
+        """
+        sequence = b''.join(
+            self.fetch(contig, *location) for location in locations)
+
+        if inverted:
+            return reverse_complement(sequence)
+        return sequence
+
+    def transcript(self, crossmap, contig):
+        """Get the spliced sequence of a transcript.
+
+        :arg object crossmap: NonCoding or Coding object.
+        :arg str contig: Contig name.
+
+        :returns bytes: Transcript sequence.
+        """
+        return self._join(
+            contig, crossmap._locations, crossmap._inverted)
+
+    def cds(self, crossmap, contig):
+        """Get the spliced sequence of the CDS of a transcript.
+
+        :arg object crossmap: Coding object.
+        :arg str contig: Contig name.
+
+        :returns bytes: CDS sequence.
+        """
+        return self._join(
+            contig, crossmap._noncoding.intersection(crossmap._cds),
+            crossmap._inverted)
+
+    def codon(self, crossmap, contig, position):
+        """Get the codon of a protein position (p.).
+
+        :arg object crossmap: Coding object.
+        :arg str contig: Contig name.
+        :arg int position: Protein position (p.).
+
+        :returns bytes: Codon sequence.
+        """
+        locations = crossmap.protein_to_locations(position, position)
+
+        if crossmap._inverted:
+            return self._join(contig, locations[::-1], True)
+        return self._join(contig, locations, False)
+
+    def flanks(self, crossmap, contig, size):
+        """Get the sequences upstream and downstream of a transcript.
+
+        :arg object crossmap: NonCoding or Coding object.
+        :arg str contig: Contig name.
+        :arg int size: Length of the flanking sequences.
+
+        :returns tuple: Upstream and downstream sequence, in transcript
+            orientation.
+        """
+        locations = crossmap._locations
+        left = self._join(
+            contig, [(locations[0][0] - size, locations[0][0])],
+            crossmap._inverted)
+        right = self._join(
+            contig, [(locations[-1][1], locations[-1][1] + size)],
+            crossmap._inverted)
+
+        if crossmap._inverted:
+            return right, left
+        return left, right
+
+    def transcript_batch(self, crossmaps, contigs):
+        """Get the spliced sequences of a list of transcripts.
+
+        :arg list crossmaps: NonCoding or Coding objects.
+        :arg list contigs: Contig names.
+
+        :returns list: Transcript sequences.
+        """
+        return list(map(self.transcript, crossmaps, contigs))
+
+    def cds_batch(self, crossmaps, contigs):
+        """Get the spliced CDS sequences of a list of transcripts.
+
+        :arg list crossmaps: Coding objects.
+        :arg list contigs: Contig names.
+
+        :returns list: CDS sequences.
+        """
+        return list(map(self.cds, crossmaps, contigs))
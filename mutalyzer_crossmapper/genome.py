@@ -0,0 +1,127 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class Genome(object):
+    """Genome object, a single coordinate system for multiple contigs.
+
+    A global coordinate is the coordinate on the concatenation of all
+    contigs, in the given order. Global coordinates fit in a signed 64-bit
+    integer and sort in contig order.
+    """
+    def __init__(self, contigs):
+        """
+        :arg list contigs: List of contigs, each a 2-tuple of the name and
+            the length.
+        """
+        self.names = tuple(contig[0] for contig in contigs)
+        self.lengths = tuple(contig[1] for contig in contigs)
+
+        self._index = {name: index for index, name in enumerate(self.names)}
+        self._offsets = tuple(
+            [0] + list(accumulate(contig[1] for contig in contigs)))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def to_global(self, contig, coordinate):
+        """Convert a coordinate on a contig to a global coordinate.
+
+        :arg str contig: Contig name.
+        :arg int coordinate: Coordinate.
+
+        :returns int: Global coordinate.
+
+        :raises ValueError: If {coordinate} lies outside the contig.
+        """
+        index = self._index[contig]
+
+        if not 0 <= coordinate < self.lengths[index]:
+            raise ValueError(
+                'coordinate {} outside contig {}'.format(coordinate, contig))
+
+        return self._offsets[index] + coordinate
+
+    def _contig(self, coordinate):
+        """Find the contig of a global coordinate.
+
+        :arg int coordinate: Global coordinate.
+
+        :returns int: Contig index.
+
+        :raises ValueError: If {coordinate} lies outside the genome.
+        """
+        if not 0 <= coordinate < self._offsets[-1]:
+            raise ValueError(
+                'global coordinate {} outside genome'.format(coordinate))
+
+        return bisect_right(self._offsets, coordinate) - 1
+
+    def to_local(self, coordinate):
+        """Convert a global coordinate to a coordinate on a contig.
+
+        :arg int coordinate: Global coordinate.
+
+        :returns tuple: Contig name and coordinate.
+
+        :raises ValueError: If {coordinate} lies outside the genome.
+        """
+        index = self._contig(coordinate)
+
+        return self.names[index], coordinate - self._offsets[index]
+
+    def to_global_batch(self, contigs, coordinates):
+        """Convert coordinates on contigs to global coordinates.
+
+        :arg list contigs: Contig names.
+        :arg list coordinates: Coordinates.
+
+        :returns array: Global coordinates.
+
+        :raises ValueError: If a coordinate lies outside its contig.
+        """
+        return array('q', map(self.to_global, contigs, coordinates))
+
+    def to_local_batch(self, coordinates):
+        """Convert global coordinates to coordinates on contigs.
+
+        :arg list coordinates: Global coordinates.
+
+        :returns tuple: List of contig names and array of coordinates.
+
+        :raises ValueError: If a coordinate lies outside the genome.
+        """
+        names = []
+        local = array('q')
+
+        for name, coordinate in map(self.to_local, coordinates):
+            names.append(name)
+            local.append(coordinate)
+
+        return names, local
+
+    def route(self, coordinates):
+        """Group global coordinates per contig.
+
+        :arg list coordinates: Global coordinates.
+
+        :returns list: List of 3-tuples (contig name, indices in
+            `coordinates`, coordinates on the contig), in contig order.
+            Contigs without coordinates are omitted.
+
+        :raises ValueError: If a coordinate lies outside the genome.
+        """
+        groups = {}
+        offsets = self._offsets
+
+        for i, coordinate in enumerate(coordinates):
+            index = self._contig(coordinate)
+
+            if index not in groups:
+                groups[index] = array('q'), array('q')
+            groups[index][0].append(i)
+            groups[index][1].append(coordinate - offsets[index])
+
+        return [
+            (self.names[index], *groups[index]) for index in sorted(groups)]
@@ -0,0 +1,42 @@
+from .crossmapper import Coding
+
+
+def join(coordinates, crossmaps, flank=0):
+    """Find all pairs of a coordinate and a transcript that overlap,
+    including flanking regions, and convert the coordinates.
+
+    Both inputs are read once, so they can be streams. Only the transcripts
+    that can overlap with the current coordinate are kept in memory.
+
+    :arg iter coordinates: Coordinates, in ascending order.
+    :arg iter crossmaps: NonCoding or Coding objects, in ascending order of
+        the start of their first exon.
+    :arg int flank: Size of the flanking regions.
+
+    :returns iter: 3-tuples of a coordinate, a crossmap object and the
+        coding position (c./r.) for Coding objects or the noncoding
+        position (n./r.) otherwise.
+    """
+    crossmaps = iter(crossmaps)
+    following = next(crossmaps, None)
+    active = []
+
+    for coordinate in coordinates:
+        while (following is not None and
+                following._locations[0][0] - flank <= coordinate):
+            active.append(following)
+            following = next(crossmaps, None)
+
+        active = [
+            crossmap for crossmap in active
+            if coordinate < crossmap._locations[-1][1] + flank]
+
+        for crossmap in active:
+            if isinstance(crossmap, Coding):
+                yield (
+                    coordinate, crossmap,
+                    crossmap.coordinate_to_coding(coordinate))
+            else:
+                yield (
+                    coordinate, crossmap,
+                    crossmap.coordinate_to_noncoding(coordinate))
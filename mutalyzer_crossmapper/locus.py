@@ -10,6 +10,10 @@ class Locus(object):
         self.boundary = location[0], location[1] - 1
         self._end = self.boundary[1] - self.boundary[0]
 
+    def __reduce__(self):
+        return type(self), (
+            (self.boundary[0], self.boundary[1] + 1), self._inverted)
+
     def to_position(self, coordinate):
         """Convert a coordinate to a proper position.
 
@@ -1,10 +1,16 @@
+from array import array
 from bisect import bisect_right
-from itertools import accumulate
+from itertools import accumulate, islice
+from weakref import WeakValueDictionary
 
 from .location import nearest_location
 from .locus import Locus
 
 
+_interned = WeakValueDictionary()
+_strategies = ('dense', 'bisect', 'sweep', 'sort')
+
+
 def _offsets(locations, orientation):
     """For each location, calculate the length of the preceding locations.
 
@@ -17,25 +23,126 @@ def _offsets(locations, orientation):
         lambda x: x[1] - x[0], locations[::orientation][:-1])))
 
 
+def _ascending(coordinates):
+    """Check whether coordinates are in ascending order.
+
+    :arg list coordinates: Coordinates.
+
+    :returns bool: True if {coordinates} are in ascending order.
+    """
+    return all(previous <= current for previous, current in zip(
+        coordinates, islice(coordinates, 1, None)))
+
+
+def _pack(locations):
+    """Pack a list of locations into a tuple of differences between
+    consecutive boundaries.
+
+    :arg list locations: List of locations.
+
+    :returns tuple: Packed locations.
+    """
+    boundaries = [boundary for location in locations for boundary in location]
+
+    return tuple(
+        current - previous
+        for previous, current in zip([0] + boundaries, boundaries))
+
+
+def _unpack(cls, packed, *args):
+    """Construct an object from packed locations.
+
+    :arg type cls: Class of the object.
+    :arg tuple packed: Packed locations.
+    :arg list args: Remaining constructor arguments.
+
+    :returns object: New object.
+    """
+    boundaries = list(accumulate(packed))
+
+    return cls(list(zip(boundaries[::2], boundaries[1::2])), *args)
+
+
 class MultiLocus(object):
     """MultiLocus object."""
-    def __init__(self, locations, inverted=False):
+    def __init__(self, locations, inverted=False, dense=0):
         """
         :arg list locations: List of locus locations.
         :arg bool inverted: Orientation.
+        :arg int dense: Memory ceiling in bytes for a dense lookup table, no
+            table is made when it does not fit (0: disabled).
         """
-        self._locations = locations
+        self._locations = tuple(locations)
         self._inverted = inverted
+        self._dense = dense
 
-        self._loci = [Locus(location, inverted) for location in locations]
+        self._loci = tuple(Locus(location, inverted) for location in locations)
         self._orientation = -1 if inverted else 1
-        self._offsets = _offsets(locations, self._orientation)
+        self._offsets = tuple(_offsets(locations, self._orientation))
+
+        self._table = None
+        if self._locations:
+            self._table_start = self._locations[0][0]
+            size = self._locations[-1][1] - self._table_start
+
+            if 2 * size * array('i').itemsize <= dense:
+                self._table = self._dense_table()
+
+    def _dense_table(self):
+        """Make a lookup table of the positions of all coordinates between
+        the start of the first locus and the end of the last locus.
+
+        :returns tuple: Arrays of positions and offsets.
+        """
+        positions = array('i')
+        offsets = array('i')
+        step = self._orientation
+
+        for coordinate, size, pos in self.to_position_runs(
+                (self._table_start, self._locations[-1][1])):
+            if pos[1]:
+                positions.extend(array('i', [pos[0]]) * size)
+                offsets.extend(range(pos[1], pos[1] + step * size, step))
+            else:
+                positions.extend(range(pos[0], pos[0] + step * size, step))
+                offsets.extend(array('i', [0]) * size)
+
+        return positions, offsets
+
+    def _split(self, index):
+        """Find the first coordinate that is nearer to the next locus than to
+        a given locus.
+
+        :arg int index: Index of the locus.
+
+        :returns int: Coordinate.
+        """
+        return (
+            self._locations[index][1] + self._locations[index + 1][0] + 1 -
+            self._inverted) // 2
+
+    def __reduce__(self):
+        return _unpack, (
+            type(self), _pack(self._locations), self._inverted, self._dense)
+
+    def __len__(self):
+        return sum(location[1] - location[0] for location in self._locations)
 
     def _direction(self, index):
         if self._inverted:
-            return len(self._offsets) - index - 1
+            return len(self._loci) - index - 1
         return index
 
+    def _offset(self, index):
+        """Calculate the length of the loci preceding a locus in transcript
+        orientation.
+
+        :arg int index: Index of the locus.
+
+        :returns int: Cumulative locus length.
+        """
+        return self._offsets[self._direction(index)]
+
     def outside(self, coordinate):
         """Calculate the offset relative to this MultiLocus.
 
@@ -49,6 +156,87 @@ class MultiLocus(object):
             return coordinate - self._loci[-1].boundary[1]
         return 0
 
+    def annotate(self, coordinate):
+        """Convert a coordinate to a position and locate it with respect to
+        the loci.
+
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Position, index of the nearest locus in the
+            orientation of the MultiLocus and the distance to the nearest
+            internal locus boundary (None if there is none).
+        """
+        index = nearest_location(self._locations, coordinate, self._inverted)
+        position = self._to_position(index, coordinate)
+        locus = self._direction(index)
+
+        if position[2]:
+            distance = None
+        elif position[1]:
+            distance = abs(position[1])
+        else:
+            relative = position[0] - self._offset(index)
+            distances = []
+            if locus:
+                distances.append(relative + 1)
+            if locus < len(self._loci) - 1:
+                distances.append(self._loci[index]._end + 1 - relative)
+            distance = min(distances, default=None)
+
+        return position, locus, distance
+
+    def intersection(self, location):
+        """Calculate the intersection of a location with the loci.
+
+        :arg tuple location: Location.
+
+        :returns list: List of locations, in genomic order.
+        """
+        first = nearest_location(self._locations, location[0])
+        last = nearest_location(self._locations, location[1] - 1)
+
+        result = []
+        for locus in self._locations[first:last + 1]:
+            start = max(locus[0], location[0])
+            end = min(locus[1], location[1])
+            if start < end:
+                result.append((start, end))
+
+        return result
+
+    def to_position_runs(self, location):
+        """Convert a location to runs of positions. Within a run, either the
+        position (in a locus) or the offset (outside a locus) changes by
+        the orientation for every next coordinate. In runs upstream or
+        downstream of the loci, the upstream or downstream offset changes
+        along with the offset.
+
+        :arg tuple location: Location.
+
+        :returns list: List of runs, each a 3-tuple of the first
+            coordinate, the length and the position of the first coordinate.
+        """
+        first = nearest_location(self._locations, location[0], self._inverted)
+        last = nearest_location(
+            self._locations, location[1] - 1, self._inverted)
+
+        runs = []
+        for index in range(first, last + 1):
+            locus = self._locations[index]
+            start = location[0] if index == first else self._split(index - 1)
+            end = location[1] if index == last else self._split(index)
+
+            for piece in ((start, locus[0]), locus, (locus[1], end)):
+                piece_start = max(start, piece[0])
+                piece_end = min(end, piece[1])
+
+                if piece_start < piece_end:
+                    runs.append((
+                        piece_start, piece_end - piece_start,
+                        self._to_position(index, piece_start)))
+
+        return runs
+
     def to_position(self, coordinate):
         """Convert a coordinate to a position.
 
@@ -56,14 +244,162 @@ class MultiLocus(object):
 
         :returns tuple: Position.
         """
-        index = nearest_location(self._locations, coordinate, self._inverted)
+        if self._table:
+            index = coordinate - self._table_start
+            if 0 <= index < len(self._table[0]):
+                return self._table[0][index], self._table[1][index], 0
+
+        return self._to_position(
+            nearest_location(self._locations, coordinate, self._inverted),
+            coordinate)
+
+    def _to_position(self, index, coordinate):
+        """Convert a coordinate to a position relative to a given locus.
+
+        :arg int index: Index of the nearest locus.
+        :arg int coordinate: Coordinate.
+
+        :returns tuple: Position.
+        """
         outside = self._orientation * self.outside(coordinate)
         location = self._loci[index].to_position(coordinate)
 
         return (
-            location[0] + self._offsets[self._direction(index)],
-            location[1],
-            outside)
+            location[0] + self._offset(index), location[1], outside)
+
+    def to_position_into(self, coordinates, positions, offsets, outsides):
+        """Convert coordinates to positions, the elements of the positions
+        are written to the output buffers.
+
+        :arg list coordinates: Coordinates.
+        :arg list positions: Output buffer for the positions.
+        :arg list offsets: Output buffer for the offsets.
+        :arg list outsides: Output buffer for the upstream or downstream
+            offsets.
+        """
+        locations = self._locations
+        inverted = self._inverted
+        orientation = self._orientation
+        table = self._table
+        first = self._loci[0].boundary[0]
+        last = self._loci[-1].boundary[1]
+        if table:
+            table_start = self._table_start
+            table_size = len(table[0])
+
+        for i in range(len(coordinates)):
+            coordinate = coordinates[i]
+
+            if table and 0 <= coordinate - table_start < table_size:
+                positions[i] = table[0][coordinate - table_start]
+                offsets[i] = table[1][coordinate - table_start]
+                outsides[i] = 0
+                continue
+
+            index = nearest_location(locations, coordinate, inverted)
+            start, end = self._loci[index].boundary
+            offset = self._offset(index)
+
+            if coordinate < first:
+                outsides[i] = orientation * (coordinate - first)
+            elif coordinate > last:
+                outsides[i] = orientation * (coordinate - last)
+            else:
+                outsides[i] = 0
+
+            if inverted:
+                if coordinate > end:
+                    positions[i] = offset
+                    offsets[i] = end - coordinate
+                elif coordinate < start:
+                    positions[i] = offset + end - start
+                    offsets[i] = start - coordinate
+                else:
+                    positions[i] = offset + end - coordinate
+                    offsets[i] = 0
+            elif coordinate < start:
+                positions[i] = offset
+                offsets[i] = coordinate - start
+            elif coordinate > end:
+                positions[i] = offset + end - start
+                offsets[i] = coordinate - end
+            else:
+                positions[i] = offset + coordinate - start
+                offsets[i] = 0
+
+    def to_position_sorted(self, coordinates):
+        """Convert sorted coordinates to positions in a single sweep over the
+        loci.
+
+        :arg list coordinates: Coordinates, in ascending order.
+
+        :returns list: Positions.
+        """
+        splits = [self._split(index) for index in range(len(self._loci) - 1)]
+        index = 0
+
+        result = []
+        for coordinate in coordinates:
+            while index < len(splits) and coordinate >= splits[index]:
+                index += 1
+            result.append(self._to_position(index, coordinate))
+
+        return result
+
+    def strategy(self, coordinates):
+        """Choose the fastest strategy to convert a batch of coordinates.
+
+        - `dense`: Use the dense lookup table.
+        - `bisect`: Search the nearest locus for every coordinate, chosen
+          for batches that are small compared to the number of loci.
+        - `sweep`: Sweep over the loci, chosen for sorted batches.
+        - `sort`: Sort the batch first and then sweep over the loci.
+
+        :arg list coordinates: Coordinates.
+
+        :returns str: Name of the strategy.
+        """
+        if self._table:
+            return 'dense'
+        if 4 * len(coordinates) < len(self._loci):
+            return 'bisect'
+        if _ascending(coordinates):
+            return 'sweep'
+        return 'sort'
+
+    def to_position_batch(self, coordinates, strategy=None):
+        """Convert coordinates to positions.
+
+        :arg list coordinates: Coordinates.
+        :arg str strategy: Conversion strategy, chosen automatically by
+            default (see `strategy()`). The `sweep` strategy requires the
+            coordinates to be in ascending order, `sort` is used otherwise.
+
+        :returns list: Positions.
+
+        :raises ValueError: If {strategy} is not a known strategy, or if it
+            is `dense` and there is no dense lookup table.
+        """
+        strategy = strategy or self.strategy(coordinates)
+
+        if strategy not in _strategies:
+            raise ValueError('unknown strategy {}'.format(strategy))
+        if strategy == 'dense' and not self._table:
+            raise ValueError('no dense lookup table')
+        if strategy == 'sweep' and not _ascending(coordinates):
+            strategy = 'sort'
+
+        if strategy == 'sweep':
+            return self.to_position_sorted(coordinates)
+        if strategy == 'sort':
+            order = sorted(
+                range(len(coordinates)), key=coordinates.__getitem__)
+            result = [None] * len(coordinates)
+            for i, position in zip(order, self.to_position_sorted(
+                    coordinates[i] for i in order)):
+                result[i] = position
+            return result
+        return list(map(self.to_position, coordinates))
 
     def to_coordinate(self, position):
         """Convert a position to a coordinate.
@@ -78,3 +414,26 @@ class MultiLocus(object):
 
         return self._loci[self._direction(index)].to_coordinate(
             (position[0] - self._offsets[index], position[1]))
+
+
+def interned(locations, inverted=False, dense=0):
+    """Get a MultiLocus object that is shared with all other callers that
+    use the same arguments. Shared objects are discarded when they are no
+    longer in use.
+
+    :arg list locations: List of locus locations.
+    :arg bool inverted: Orientation.
+    :arg int dense: Memory ceiling in bytes for a dense lookup table
+        (0: disabled).
+
+    :returns object: MultiLocus object.
+    """
+    key = tuple(map(tuple, locations)), inverted, dense
+    multi_locus = _interned.get(key)
+
+    if multi_locus is None:
+        multi_locus = MultiLocus(key[0], inverted, dense)
+        multi_locus = _interned.setdefault(
+            (multi_locus._locations, inverted, dense), multi_locus)
+
+    return multi_locus
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+
+
+def _chunks(size, parts):
+    """Divide a range into contiguous chunks of nearly equal size.
+
+    :arg int size: Length of the range.
+    :arg int parts: Number of chunks.
+
+    :returns list: List of locations.
+    """
+    bounds = [size * part // parts for part in range(parts + 1)]
+
+    return [
+        (bounds[part], bounds[part + 1]) for part in range(parts)
+        if bounds[part] < bounds[part + 1]]
+
+
+def thread_map(function, *sequences, workers=None):
+    """Apply a conversion function to all elements of one or more sequences
+    using a pool of threads.
+
+    The sequences are split into one contiguous chunk per worker. Crossmap
+    objects are not modified after construction, so a single object can be
+    used by all workers. Note that threads only run concurrently on a free
+    threaded Python build, on other builds this function is equivalent to
+    `list(map(function, *sequences))`.
+
+    :arg function function: Conversion function, e.g.,
+        `Coding.coordinate_to_coding`.
+    :arg list sequences: Sequences of arguments to `function`, all of the
+        same length.
+    :arg int workers: Number of threads, defaults to the number of CPUs.
+
+    :returns list: List of converted positions.
+    """
+    workers = workers or cpu_count() or 1
+    chunks = _chunks(len(sequences[0]), workers)
+
+    if len(chunks) < 2:
+        return list(map(function, *sequences))
+
+    with ThreadPoolExecutor(len(chunks)) as executor:
+        results = executor.map(
+            lambda chunk: list(map(function, *(
+                sequence[chunk[0]:chunk[1]] for sequence in sequences))),
+            chunks)
+
+        return [position for result in results for position in result]
@@ -0,0 +1,118 @@
+import pytest
+
+from mutalyzer_crossmapper import Cache, Coding, EditableCoding, NonCoding
+from mutalyzer_crossmapper.cache import signature
+
+_exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
+_cds = (32, 43)
+
+
+class _Integer(int):
+    def __repr__(self):
+        return 'Integer({})'.format(int(self))
+
+
+def test_signature():
+    """Signatures of transcripts."""
+    crossmap = Coding(_exons, _cds)
+
+    assert signature(crossmap) == signature(Coding(list(_exons), _cds))
+    assert signature(crossmap) == signature(Coding(_exons, _cds, lazy=True))
+    assert signature(crossmap) != signature(Coding(_exons, _cds, True))
+    assert signature(crossmap) != signature(Coding(_exons, (32, 44)))
+    assert signature(crossmap) != signature(NonCoding(_exons))
+
+
+def test_signature_types():
+    """Signatures do not depend on the types of the input."""
+    crossmap = Coding(_exons, _cds)
+
+    assert signature(crossmap) == signature(Coding(_exons, list(_cds)))
+    assert signature(crossmap) == signature(Coding(
+        [tuple(map(_Integer, exon)) for exon in _exons],
+        tuple(map(_Integer, _cds))))
+
+
+def test_Cache(tmp_path):
+    """Cached conversions."""
+    crossmap = Coding(_exons, _cds, True)
+
+    with Cache(str(tmp_path / 'cache.db')) as cache:
+        assert cache.hit_rate() == 0.0
+        assert cache.coordinate_to_coding(crossmap, 31) == (
+            crossmap.coordinate_to_coding(31))
+        assert cache.coordinate_to_coding(crossmap, 31) == (
+            crossmap.coordinate_to_coding(31))
+        assert cache.coding_to_coordinate(crossmap, (3, 0, 0, 0)) == (
+            crossmap.coding_to_coordinate((3, 0, 0)))
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate() == 1 / 3
+        assert len(cache) == 2
+
+
+def test_Cache_batch(tmp_path):
+    """Cached batch conversions."""
+    crossmap = Coding(_exons, _cds)
+    coordinates = [31, 2, 31, 75, 41]
+
+    with Cache(str(tmp_path / 'cache.db')) as cache:
+        for degenerate in (False, True):
+            assert cache.coordinate_to_coding_batch(
+                crossmap, coordinates, degenerate) == [
+                    crossmap.coordinate_to_coding(coordinate, degenerate)
+                    for coordinate in coordinates]
+
+        positions = cache.coordinate_to_coding_batch(crossmap, coordinates)
+        assert cache.coding_to_coordinate_batch(
+            crossmap, positions) == coordinates
+        assert (cache.hits, cache.misses) == (5, 15)
+
+
+def test_Cache_persistent(tmp_path):
+    """Cached results are stored on disk."""
+    path = str(tmp_path / 'cache.db')
+
+    with Cache(path) as cache:
+        cache.coordinate_to_coding_batch(Coding(_exons, _cds), [31, 41])
+
+    with Cache(path) as cache:
+        assert len(cache) == 2
+        assert cache.coordinate_to_coding_batch(
+            Coding(_exons, _cds), [31, 41]) == [
+                (-1, 0, -1, 0), (5, 0, 0, 0)]
+        assert cache.hit_rate() == 1.0
+
+
+def test_Cache_size(tmp_path):
+    """The oldest results are removed when the cache is full."""
+    crossmap = Coding(_exons, _cds)
+
+    with Cache(str(tmp_path / 'cache.db'), 3) as cache:
+        cache.coordinate_to_coding_batch(crossmap, [1, 2])
+        cache.coordinate_to_coding_batch(crossmap, [3, 4])
+        assert len(cache) == 3
+
+        cache.coordinate_to_coding_batch(crossmap, [2, 3, 4])
+        assert cache.hits == 3
+        cache.coordinate_to_coding_batch(crossmap, [1])
+        assert cache.misses == 5
+
+
+def test_Cache_shared(tmp_path):
+    """Results stored by another cache are counted."""
+    path = str(tmp_path / 'cache.db')
+    crossmap = Coding(_exons, _cds)
+
+    with Cache(path) as first, Cache(path) as second:
+        first.coordinate_to_coding_batch(crossmap, [31, 41])
+        second.coordinate_to_coding_batch(crossmap, [31, 41, 2])
+
+        assert (second.hits, second.misses) == (2, 1)
+        assert len(first) == len(second) == 3
+
+
+def test_Cache_editable(tmp_path):
+    """Editable transcripts are rejected."""
+    with Cache(str(tmp_path / 'cache.db')) as cache:
+        with pytest.raises(TypeError):
+            cache.coordinate_to_coding(EditableCoding(_exons, _cds), 31)
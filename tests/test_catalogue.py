@@ -0,0 +1,157 @@
+import pytest
+
+from mutalyzer_crossmapper import Catalogue, Coding, NonCoding
+
+_exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
+_cds = (32, 43)
+
+_transcripts = [
+    (_exons, _cds, False),
+    (_exons, _cds, True),
+    ([(10, 20), (20, 30)], (12, 25), False),
+    ([(10, 20), (20, 30)], (12, 25), True),
+    ([(100, 200)], (110, 190), True),
+    ([(40, 44), (50, 52)], None, False)]
+
+
+def _catalogue():
+    exons = []
+    index = [0]
+    for transcript in _transcripts:
+        exons.extend(transcript[0])
+        index.append(len(exons))
+
+    return Catalogue(
+        exons, index, [transcript[1] for transcript in _transcripts],
+        [transcript[2] for transcript in _transcripts])
+
+
+def _pairs(transcripts):
+    pairs = [
+        (transcript, coordinate) for transcript in transcripts
+        for coordinate in range(0, 220)]
+
+    return [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+
+
+def test_Catalogue_len():
+    """Number of transcripts in a catalogue."""
+    assert len(_catalogue()) == 6
+
+
+def test_Catalogue_noncoding():
+    """Ragged batch conversion to noncoding positions."""
+    transcripts, coordinates = _pairs(range(6))
+
+    assert _catalogue().coordinate_to_noncoding(transcripts, coordinates) == [
+        NonCoding(_transcripts[transcript][0], _transcripts[transcript][2])
+        .coordinate_to_noncoding(coordinate)
+        for transcript, coordinate in zip(transcripts, coordinates)]
+
+
+def test_Catalogue_coding():
+    """Ragged batch conversion to coding positions."""
+    transcripts, coordinates = _pairs(range(5))
+    crossmaps = [Coding(*transcript) for transcript in _transcripts[:5]]
+
+    assert _catalogue().coordinate_to_coding(transcripts, coordinates) == [
+        crossmaps[transcript].coordinate_to_coding(coordinate)
+        for transcript, coordinate in zip(transcripts, coordinates)]
+
+
+def test_Catalogue_coding_degenerate():
+    """Ragged batch conversion to degenerate coding positions."""
+    transcripts, coordinates = _pairs(range(5))
+    crossmaps = [Coding(*transcript) for transcript in _transcripts[:5]]
+
+    assert _catalogue().coordinate_to_coding(
+        transcripts, coordinates, True) == [
+            crossmaps[transcript].coordinate_to_coding(coordinate, True)
+            for transcript, coordinate in zip(transcripts, coordinates)]
+
+
+def test_Catalogue_protein():
+    """Ragged batch conversion to protein positions."""
+    transcripts, coordinates = _pairs(range(5))
+    crossmaps = [Coding(*transcript) for transcript in _transcripts[:5]]
+
+    assert _catalogue().coordinate_to_protein(transcripts, coordinates) == [
+        crossmaps[transcript].coordinate_to_protein(coordinate)
+        for transcript, coordinate in zip(transcripts, coordinates)]
+
+
+def test_Catalogue_noncoding_transcript():
+    """Coding conversion of a noncoding transcript."""
+    with pytest.raises(ValueError, match='transcript 5'):
+        _catalogue().coordinate_to_coding([0, 5], [31, 41])
+    with pytest.raises(ValueError, match='transcript 5'):
+        _catalogue().coordinate_to_protein([5], [41])
+
+
+def _columns():
+    starts = []
+    ends = []
+    index = [0]
+    for transcript in _transcripts:
+        starts.extend(location[0] for location in transcript[0])
+        ends.extend(location[1] for location in transcript[0])
+        index.append(len(starts))
+
+    return (
+        starts, ends, index,
+        [transcript[1][0] if transcript[1] else 0
+         for transcript in _transcripts],
+        [transcript[1][1] if transcript[1] else 0
+         for transcript in _transcripts],
+        ['-' if transcript[2] else '+' for transcript in _transcripts])
+
+
+def test_Catalogue_from_arrays():
+    """Columnar construction of a catalogue."""
+    catalogue = Catalogue.from_arrays(*_columns())
+    transcripts, coordinates = _pairs(range(5))
+
+    assert len(catalogue) == 6
+    assert catalogue.coordinate_to_coding(
+        transcripts, coordinates) == _catalogue().coordinate_to_coding(
+            transcripts, coordinates)
+
+
+def test_Catalogue_from_arrays_empty():
+    """Transcripts without exons do not shift the other transcripts."""
+    catalogue = Catalogue.from_arrays(
+        [5, 14, 30], [8, 20, 35], [0, 0, 2, 3], [0, 6, 31], [0, 17, 33],
+        ['-', '-', '+'])
+
+    assert catalogue._offsets == Catalogue(
+        [(5, 8), (14, 20), (30, 35)], [0, 0, 2, 3],
+        [None, (6, 17), (31, 33)], [True, True, False])._offsets
+    assert catalogue.coordinate_to_coding([1, 2], [15, 32]) == [
+        Coding([(5, 8), (14, 20)], (6, 17), True).coordinate_to_coding(15),
+        Coding([(30, 35)], (31, 33)).coordinate_to_coding(32)]
+
+
+def test_Catalogue_from_arrays_strands():
+    """Numeric strands."""
+    columns = _columns()
+    catalogue = Catalogue.from_arrays(*columns[:5], [
+        -1 if strand == '-' else 1 for strand in columns[5]])
+
+    assert catalogue._inverted == Catalogue.from_arrays(*columns)._inverted
+
+
+def test_Catalogue_crossmap():
+    """Construct per transcript crossmap objects."""
+    catalogue = Catalogue.from_arrays(*_columns())
+
+    for transcript in range(5):
+        crossmap = catalogue.crossmap(transcript, lazy=True)
+        reference = Coding(*_transcripts[transcript])
+
+        assert isinstance(crossmap, Coding)
+        assert [crossmap.coordinate_to_coding(i) for i in range(220)] == [
+            reference.coordinate_to_coding(i) for i in range(220)]
+
+    crossmap = catalogue.crossmap(5)
+    assert type(crossmap) is NonCoding
+    assert crossmap._locations == ((40, 44), (50, 52))
@@ -1,4 +1,9 @@
-from mutalyzer_crossmapper import Coding, Genomic, NonCoding
+from array import array
+from pickle import dumps, loads
+
+import pytest
+
+from mutalyzer_crossmapper import Coding, EditableCoding, Genomic, NonCoding
 
 from helper import degenerate_equal, invariant
 
@@ -6,6 +11,14 @@ _exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
 _cds = (32, 43)
 
 
+class _NonCoding(NonCoding):
+    pass
+
+
+class _Coding(Coding):
+    pass
+
+
 def test_Genomic():
     """Genomic positions are coordinates incremented by one."""
     crossmap = Genomic()
@@ -413,3 +426,301 @@ def test_Coding_protein():
     invariant(
         crossmap.coordinate_to_protein, 43,
         crossmap.protein_to_coordinate, (1, 1, 0, 1, 0))
+
+
+def test_Coding_dense():
+    """Coding transcripts with a dense lookup table."""
+    for inverted in (False, True):
+        crossmap = Coding(_exons, _cds, inverted)
+        dense = Coding(_exons, _cds, inverted, 1024)
+
+        for coordinate in range(80):
+            assert (dense.coordinate_to_coding(coordinate) ==
+                    crossmap.coordinate_to_coding(coordinate))
+            assert (dense.coordinate_to_protein(coordinate) ==
+                    crossmap.coordinate_to_protein(coordinate))
+
+
+def test_NonCoding_into():
+    """Conversion into output buffers."""
+    for inverted in (False, True):
+        crossmap = NonCoding(_exons, inverted)
+        buffers = [array('l', [0] * 80) for _ in range(3)]
+
+        crossmap.coordinate_to_noncoding_into(range(80), *buffers)
+        assert list(zip(*buffers)) == list(
+            map(crossmap.coordinate_to_noncoding, range(80)))
+
+
+def test_Coding_into():
+    """Conversion into output buffers."""
+    for cls in (Coding, EditableCoding):
+        for inverted in (False, True):
+            for degenerate in (False, True):
+                crossmap = cls(_exons, _cds, inverted)
+                buffers = [array('l', [0] * 80) for _ in range(4)]
+
+                crossmap.coordinate_to_coding_into(
+                    range(80), *buffers, degenerate=degenerate)
+                assert list(zip(*buffers)) == [
+                    crossmap.coordinate_to_coding(coordinate, degenerate)
+                    for coordinate in range(80)]
+
+
+def test_Coding_protein_to_locations():
+    """Locations of a protein range."""
+    crossmap = Coding(_exons, _cds)
+
+    assert crossmap.protein_to_locations(1, 1) == [(32, 35)]
+    assert crossmap.protein_to_locations(2, 2) == [(40, 43)]
+    assert crossmap.protein_to_locations(1, 2) == [(32, 35), (40, 43)]
+
+
+def test_Coding_protein_to_locations_split():
+    """Locations of a protein range with a codon split by an intron."""
+    crossmap = Coding(_exons, (33, 43))
+
+    assert crossmap.protein_to_locations(1, 1) == [(33, 35), (40, 41)]
+    assert crossmap.protein_to_locations(2, 2) == [(41, 44)]
+
+
+def test_Coding_protein_to_locations_inverted():
+    """Locations of a protein range on the reverse complement strand."""
+    crossmap = Coding(_exons, (19, 43), True)
+
+    assert crossmap.protein_to_locations(1, 1) == [(40, 43)]
+    assert crossmap.protein_to_locations(2, 3) == [(30, 35), (19, 20)]
+    assert crossmap.protein_to_locations_batch([(1, 1), (1, 2)]) == [
+        [(40, 43)], [(40, 43), (32, 35)]]
+
+
+def test_NonCoding_annotate():
+    """Annotated noncoding positions."""
+    crossmap = NonCoding(_exons)
+
+    assert crossmap.annotate(2) == (1, -3, -3, None, None, 'upstream')
+    assert crossmap.annotate(5) == (1, 0, 0, 1, 3, 'exon')
+    assert crossmap.annotate(9) == (3, 2, 0, 1, 2, 'intron')
+    assert crossmap.annotate(12) == (4, -2, 0, 1, 2, 'intron')
+    assert crossmap.annotate(31) == (11, 0, 0, 3, 2, 'exon')
+    assert crossmap.annotate(75) == (22, 4, 4, None, None, 'downstream')
+
+
+def test_NonCoding_annotate_inverted():
+    """Annotated noncoding positions on the reverse complement strand."""
+    crossmap = NonCoding(_exons, True)
+
+    assert crossmap.annotate(2) == (22, 3, 3, None, None, 'downstream')
+    assert crossmap.annotate(9) == (20, -2, 0, 5, 2, 'intron')
+    assert crossmap.annotate(43) == (5, 0, 0, 3, 1, 'exon')
+    assert crossmap.annotate(71) == (1, 0, 0, 1, 2, 'exon')
+
+
+def test_NonCoding_annotate_single_exon():
+    """Annotated noncoding positions of a single exon transcript."""
+    crossmap = NonCoding([(10, 20)])
+
+    assert crossmap.annotate(15) == (6, 0, 0, 1, None, 'exon')
+
+
+def test_Coding_annotate():
+    """Annotated coding positions."""
+    crossmap = Coding(_exons, _cds)
+
+    assert crossmap.annotate(7) == (-9, 0, -1, 0, 1, 1, 'utr5')
+    assert crossmap.annotate(36) == (3, 2, 0, 0, 3, 2, 'intron')
+    assert crossmap.annotate(41) == (5, 0, 0, 0, 4, 2, 'cds')
+    assert crossmap.annotate(43) == (1, 0, 1, 0, 4, 1, 'utr3')
+    assert crossmap.annotate_batch([2, 41]) == [
+        (-11, -3, -1, -3, None, None, 'upstream'),
+        (5, 0, 0, 0, 4, 2, 'cds')]
+
+
+def test_Coding_annotate_positions():
+    """Annotated positions equal converted positions."""
+    for cls in (Coding, EditableCoding):
+        for inverted in (False, True):
+            crossmap = cls(_exons, _cds, inverted)
+
+            for coordinate in range(80):
+                assert (crossmap.annotate(coordinate)[:4] ==
+                        crossmap.coordinate_to_coding(coordinate))
+
+
+def test_Coding_annotate_editable():
+    """Annotated coding positions of an editable transcript."""
+    for inverted in (False, True):
+        crossmap = Coding(_exons, _cds, inverted)
+        editable = EditableCoding(_exons, _cds, inverted)
+
+        for coordinate in range(80):
+            assert (editable.annotate(coordinate) ==
+                    crossmap.annotate(coordinate))
+
+
+def test_Coding_lazy():
+    """Lazy construction of a coding transcript."""
+    for inverted in (False, True):
+        crossmap = Coding(_exons, _cds, inverted)
+        lazy = Coding(_exons, _cds, inverted, lazy=True)
+
+        assert '_noncoding' not in lazy.__dict__
+        assert '_coding' not in lazy.__dict__
+        assert lazy.coordinate_to_protein(41) == (
+            crossmap.coordinate_to_protein(41))
+        assert '_coding' in lazy.__dict__
+
+        for coordinate in range(80):
+            assert (lazy.coordinate_to_coding(coordinate) ==
+                    crossmap.coordinate_to_coding(coordinate))
+
+
+def test_NonCoding_lazy():
+    """Lazy construction of a noncoding transcript."""
+    crossmap = NonCoding(_exons, lazy=True)
+
+    assert '_noncoding' not in crossmap.__dict__
+    assert crossmap.noncoding_to_coordinate((14, 1)) == 35
+    assert '_noncoding' in crossmap.__dict__
+
+
+def test_NonCoding_missing_attribute():
+    """Missing attributes are not constructed."""
+    crossmap = NonCoding(_exons, lazy=True)
+
+    with pytest.raises(AttributeError):
+        crossmap._coding
+
+
+def test_Coding_lazy_copy():
+    """The CDS of a lazy transcript is copied on construction."""
+    cds = list(_cds)
+    crossmap = Coding(_exons, cds, lazy=True)
+    cds[0] = 40
+
+    assert crossmap.coordinate_to_coding(41) == (5, 0, 0, 0)
+
+
+def test_Coding_intern():
+    """Coding transcripts with shared internal structures."""
+    crossmap = Coding(_exons, _cds, intern=True)
+    other = Coding(list(_exons), (30, 45), intern=True)
+
+    assert crossmap._noncoding is other._noncoding
+    assert crossmap._locations is other._locations
+    assert crossmap.coordinate_to_coding(31) == (-1, 0, -1, 0)
+    assert other.coordinate_to_coding(31) == (2, 0, 0, 0)
+    assert other.coordinate_to_coding(44) == (
+        Coding(_exons, (30, 45)).coordinate_to_coding(44))
+
+
+def test_NonCoding_runs():
+    """Runs of noncoding positions."""
+    crossmap = NonCoding(_exons, True)
+
+    assert crossmap.coordinate_to_noncoding_runs((30, 42)) == [
+        (30, 5, (13, 0, 0)), (35, 2, (9, -1, 0)), (37, 3, (8, 3, 0)),
+        (40, 2, (8, 0, 0))]
+
+
+def test_NonCoding_project_coverage():
+    """Coverage projected onto the transcript."""
+    coverage = list(range(100, 140))
+
+    assert NonCoding(_exons).project_coverage(10, coverage) == [
+        0, 0, 0, 104, 105, 106, 107, 108, 109, 120, 121, 122, 123, 124, 130,
+        131, 132, 133, 0, 0, 0, 0]
+    assert NonCoding(_exons, True).project_coverage(10, coverage) == [
+        0, 0, 0, 0, 133, 132, 131, 130, 124, 123, 122, 121, 120, 109, 108,
+        107, 106, 105, 104, 0, 0, 0]
+
+
+def test_NonCoding_blocks():
+    """Aligned read blocks in noncoding positions."""
+    crossmap = NonCoding(_exons)
+    reads = [
+        [(31, 35), (40, 42)], [(6, 8), (15, 16)], [(33, 35), (38, 42)],
+        [(15, 18), (18, 19)], [(60, 75)], []]
+
+    assert crossmap.blocks_to_noncoding(reads) == [
+        ([(crossmap.coordinate_to_noncoding(block[0]),
+           crossmap.coordinate_to_noncoding(block[1] - 1))
+          for block in blocks], flag)
+        for blocks, flag in zip(
+            reads, [True, False, False, True, True, True])]
+
+
+def test_Coding_blocks():
+    """Aligned read blocks in coding positions."""
+    crossmap = Coding(_exons, _cds, True)
+    reads = [[(31, 35), (40, 42)], [(2, 6)], [(7, 8), (14, 16), (30, 33)]]
+
+    assert crossmap.blocks_to_coding(reads) == [
+        ([(crossmap.coordinate_to_coding(block[0]),
+           crossmap.coordinate_to_coding(block[1] - 1))
+          for block in blocks], flag)
+        for blocks, flag in zip(reads, [True, True, False])]
+
+
+def test_NonCoding_pickle():
+    """Pickled noncoding transcript."""
+    crossmap = loads(dumps(NonCoding(_exons, True)))
+
+    assert crossmap.coordinate_to_noncoding(35) == (9, -1, 0)
+
+
+def test_Coding_pickle():
+    """Pickled coding transcript."""
+    for inverted in (False, True):
+        crossmap = Coding(_exons, _cds, inverted)
+        copy = loads(dumps(crossmap))
+
+        assert type(copy) is Coding
+        assert list(map(copy.coordinate_to_coding, range(80))) == list(
+            map(crossmap.coordinate_to_coding, range(80)))
+
+
+def test_Coding_pickle_subclass():
+    """Pickled subclasses keep their class."""
+    for crossmap in (_NonCoding(_exons), _Coding(_exons, _cds)):
+        copy = loads(dumps(crossmap))
+
+        assert type(copy) is type(crossmap)
+        assert list(map(copy.coordinate_to_noncoding, range(80))) == list(
+            map(crossmap.coordinate_to_noncoding, range(80)))
+
+
+def test_Coding_pickle_lazy():
+    """Pickled lazy coding transcript."""
+    crossmap = Coding(_exons, _cds, lazy=True)
+
+    assert '_noncoding' not in loads(dumps(crossmap)).__dict__
+    crossmap.coordinate_to_coding(31)
+    assert '_noncoding' in loads(dumps(crossmap)).__dict__
+
+
+def test_Coding_pickle_size():
+    """Pickled coding transcripts only contain the exons and the CDS."""
+    assert len(dumps(Coding(_exons, _cds))) < 200
+
+
+def test_NonCoding_batch():
+    """Batch conversion to noncoding positions."""
+    crossmap = NonCoding(_exons, True)
+    coordinates = [40, 5, 72, 31, 31]
+
+    assert crossmap.strategy(coordinates) == 'sort'
+    assert crossmap.coordinate_to_noncoding_batch(coordinates) == list(
+        map(crossmap.coordinate_to_noncoding, coordinates))
+
+
+def test_Coding_batch():
+    """Batch conversion to coding positions."""
+    for inverted in (False, True):
+        crossmap = Coding(_exons, _cds, inverted)
+
+        for degenerate in (False, True):
+            assert crossmap.coordinate_to_coding_batch(
+                range(80), degenerate) == [
+                    crossmap.coordinate_to_coding(coordinate, degenerate)
+                    for coordinate in range(80)]
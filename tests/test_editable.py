@@ -0,0 +1,121 @@
+from pickle import dumps, loads
+
+from mutalyzer_crossmapper import Coding, EditableCoding, MultiLocus
+from mutalyzer_crossmapper.editable import _FenwickTree
+
+_exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
+_cds = (32, 43)
+
+
+def _equal(crossmap, exons, inverted):
+    expected = Coding(exons, _cds, inverted)
+
+    for coordinate in range(0, 80):
+        position = crossmap.coordinate_to_coding(coordinate)
+        assert position == expected.coordinate_to_coding(coordinate)
+        assert crossmap.coding_to_coordinate(position) == coordinate
+        assert (crossmap.coordinate_to_noncoding(coordinate) ==
+                expected.coordinate_to_noncoding(coordinate))
+
+
+def test_FenwickTree():
+    """Prefix sums and searches."""
+    tree = _FenwickTree([3, 6, 5, 4, 2, 2])
+
+    assert [tree.prefix(i) for i in range(7)] == [0, 3, 9, 14, 18, 20, 22]
+    assert [tree.search(v) for v in (-1, 0, 2, 3, 8, 9, 21, 22, 30)] == [
+        -1, 0, 0, 1, 1, 2, 5, 6, 6]
+
+
+def test_FenwickTree_add():
+    """Prefix sums after an update."""
+    tree = _FenwickTree([3, 6, 5, 4, 2, 2])
+    tree.add(2, -3)
+
+    assert [tree.prefix(i) for i in range(7)] == [0, 3, 9, 11, 15, 17, 19]
+
+
+def test_EditableMultiLocus():
+    """Unedited EditableMultiLocus equals MultiLocus."""
+    for inverted in (False, True):
+        crossmap = EditableCoding(_exons, _cds, inverted)
+        multi_locus = MultiLocus(_exons, inverted)
+
+        for coordinate in range(0, 80):
+            position = crossmap._noncoding.to_position(coordinate)
+            assert position == multi_locus.to_position(coordinate)
+            assert crossmap._noncoding.to_coordinate(position) == coordinate
+
+
+def test_EditableCoding_insert():
+    """Insert an exon."""
+    for inverted in (False, True):
+        crossmap = EditableCoding(_exons, _cds, inverted)
+
+        assert crossmap.insert_exon((24, 27)) == 2
+        _equal(crossmap, _exons[:2] + [(24, 27)] + _exons[2:], inverted)
+
+
+def test_EditableCoding_copy():
+    """The CDS is copied on construction."""
+    cds = list(_cds)
+    crossmap = EditableCoding(_exons, cds)
+    cds[0] = 40
+
+    crossmap.insert_exon((24, 27))
+    _equal(crossmap, _exons[:2] + [(24, 27)] + _exons[2:], False)
+
+
+def test_EditableCoding_remove():
+    """Remove an exon."""
+    for inverted in (False, True):
+        crossmap = EditableCoding(_exons, _cds, inverted)
+
+        crossmap.remove_exon(1)
+        _equal(crossmap, _exons[:1] + _exons[2:], inverted)
+
+
+def test_EditableCoding_resize():
+    """Resize an exon."""
+    for inverted in (False, True):
+        crossmap = EditableCoding(_exons, _cds, inverted)
+
+        crossmap.resize_exon(2, (28, 36))
+        _equal(crossmap, _exons[:2] + [(28, 36)] + _exons[3:], inverted)
+
+
+def test_EditableCoding_edits():
+    """A series of edits."""
+    for inverted in (False, True):
+        crossmap = EditableCoding(_exons, _cds, inverted)
+
+        crossmap.remove_exon(5)
+        crossmap.insert_exon((60, 66))
+        crossmap.resize_exon(0, (2, 8))
+        crossmap.remove_exon(1)
+        _equal(
+            crossmap, [(2, 8), (30, 35), (40, 44), (50, 52), (60, 66)],
+            inverted)
+
+
+def test_EditableCoding_pickle():
+    """Pickled edited transcript."""
+    crossmap = EditableCoding(_exons, _cds, True)
+    crossmap.remove_exon(1)
+    copy = loads(dumps(crossmap))
+
+    assert type(copy) is EditableCoding
+    _equal(copy, _exons[:1] + _exons[2:], True)
+
+
+def test_EditableCoding_batch():
+    """Batch conversion of an edited transcript."""
+    for inverted in (False, True):
+        crossmap = EditableCoding(_exons, _cds, inverted)
+        crossmap.remove_exon(1)
+        expected = Coding(_exons[:1] + _exons[2:], _cds, inverted)
+
+        for strategy in ('bisect', 'sweep', 'sort'):
+            assert crossmap.coordinate_to_coding_batch(
+                range(80), strategy=strategy) == list(
+                    map(expected.coordinate_to_coding, range(80)))
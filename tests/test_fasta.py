@@ -0,0 +1,115 @@
+import pytest
+
+from mutalyzer_crossmapper import Coding, Fasta, NonCoding
+from mutalyzer_crossmapper.fasta import reverse_complement
+
+_exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
+_cds = (32, 43)
+_sequences = {
+    'chr1': 'ACGTTGCAAGGCATCCGATTAGCCGTAACGTATGCCAGTTACGGATCCAAGT'
+            'CGATTGACCTGAGCTTACGGATCGATCAG',
+    'chr2': 'GATTACAgattaca'}
+
+
+@pytest.fixture
+def fasta(tmp_path):
+    path = str(tmp_path / 'test.fa')
+    offset = 0
+
+    with open(path, 'w') as handle, open(path + '.fai', 'w') as index:
+        for name, sequence in _sequences.items():
+            header = '>{}\n'.format(name)
+            lines = [
+                sequence[i:i + 10] + '\n'
+                for i in range(0, len(sequence), 10)]
+            handle.write(header + ''.join(lines))
+
+            offset += len(header)
+            index.write('{}\t{}\t{}\t10\t11\n'.format(
+                name, len(sequence), offset))
+            offset += len(''.join(lines))
+
+    with Fasta(path) as reader:
+        yield reader
+
+
+def _spliced(locations):
+    return ''.join(
+        _sequences['chr1'][start:end] for start, end in locations).encode()
+
+
+def test_reverse_complement():
+    """Reverse complement of a sequence."""
+    assert reverse_complement(b'AACGTNacgt') == b'acgtNACGTT'
+
+
+def test_Fasta_fetch(fasta):
+    """Sequence of a location."""
+    for name, sequence in _sequences.items():
+        for start in range(len(sequence)):
+            for end in range(start, len(sequence) + 1):
+                assert fasta.fetch(name, start, end) == (
+                    sequence[start:end].encode())
+
+
+def test_Fasta_fetch_clipped(fasta):
+    """Sequence of a location that exceeds the contig."""
+    assert fasta.fetch('chr2', -3, 3) == b'GAT'
+    assert fasta.fetch('chr2', 12, 20) == b'ca'
+
+
+def test_Fasta_transcript(fasta):
+    """Spliced transcript sequences."""
+    assert fasta.transcript(NonCoding(_exons), 'chr1') == _spliced(_exons)
+    assert fasta.transcript(NonCoding(_exons, True), 'chr1') == (
+        reverse_complement(_spliced(_exons)))
+
+
+def test_Fasta_lazy(fasta):
+    """Sequences of a lazy transcript do not construct it."""
+    crossmap = Coding(_exons, _cds, lazy=True)
+
+    assert fasta.transcript(crossmap, 'chr1') == _spliced(_exons)
+    assert fasta.flanks(crossmap, 'chr1', 3) == (
+        _spliced([(2, 5)]), _spliced([(72, 75)]))
+    assert '_noncoding' not in crossmap.__dict__
+
+
+def test_Fasta_cds(fasta):
+    """Spliced CDS sequences."""
+    assert fasta.cds(Coding(_exons, _cds), 'chr1') == _spliced(
+        [(32, 35), (40, 43)])
+    assert fasta.cds(Coding(_exons, _cds, True), 'chr1') == (
+        reverse_complement(_spliced([(32, 35), (40, 43)])))
+
+
+def test_Fasta_codon(fasta):
+    """Codon sequences."""
+    crossmap = Coding(_exons, (33, 43))
+
+    assert fasta.codon(crossmap, 'chr1', 1) == _spliced([(33, 35), (40, 41)])
+    assert fasta.codon(crossmap, 'chr1', 2) == _spliced([(41, 44)])
+
+    crossmap = Coding(_exons, (19, 43), True)
+
+    assert fasta.codon(crossmap, 'chr1', 3) == reverse_complement(
+        _spliced([(19, 20), (30, 32)]))
+
+
+def test_Fasta_flanks(fasta):
+    """Flanking sequences."""
+    assert fasta.flanks(NonCoding(_exons), 'chr1', 3) == (
+        _spliced([(2, 5)]), _spliced([(72, 75)]))
+    assert fasta.flanks(NonCoding(_exons, True), 'chr1', 3) == (
+        reverse_complement(_spliced([(72, 75)])),
+        reverse_complement(_spliced([(2, 5)])))
+
+
+def test_Fasta_batch(fasta):
+    """Batch extraction."""
+    crossmaps = [Coding(_exons, _cds), Coding(_exons, _cds, True)]
+
+    assert fasta.transcript_batch(crossmaps, ['chr1', 'chr1']) == [
+        fasta.transcript(crossmap, 'chr1') for crossmap in crossmaps]
+    assert fasta.cds_batch(crossmaps, ['chr1', 'chr1']) == [
+        fasta.cds(crossmap, 'chr1') for crossmap in crossmaps]
@@ -0,0 +1,65 @@
+from array import array
+
+import pytest
+
+from mutalyzer_crossmapper import Genome
+
+from helper import invariant
+
+_contigs = [('chr1', 100), ('chr2', 50), ('chrM', 16)]
+
+
+def test_Genome():
+    """Global coordinates."""
+    genome = Genome(_contigs)
+
+    assert len(genome) == 166
+    invariant(
+        lambda x: genome.to_global(*x), ('chr1', 0), genome.to_local, 0)
+    invariant(
+        lambda x: genome.to_global(*x), ('chr1', 99), genome.to_local, 99)
+    invariant(
+        lambda x: genome.to_global(*x), ('chr2', 0), genome.to_local, 100)
+    invariant(
+        lambda x: genome.to_global(*x), ('chrM', 15), genome.to_local, 165)
+
+
+def test_Genome_batch():
+    """Batch conversion of global coordinates."""
+    genome = Genome(_contigs)
+    contigs = ['chr2', 'chr1', 'chrM', 'chr2']
+    coordinates = [3, 99, 0, 49]
+
+    assert genome.to_global_batch(contigs, coordinates) == array(
+        'q', [103, 99, 150, 149])
+    assert genome.to_local_batch([103, 99, 150, 149]) == (
+        contigs, array('q', coordinates))
+
+
+def test_Genome_route():
+    """Grouping of global coordinates per contig."""
+    genome = Genome(_contigs)
+
+    assert genome.route([160, 5, 103, 7, 151]) == [
+        ('chr1', array('q', [1, 3]), array('q', [5, 7])),
+        ('chr2', array('q', [2]), array('q', [3])),
+        ('chrM', array('q', [0, 4]), array('q', [10, 1]))]
+
+
+def test_Genome_outside():
+    """Coordinates outside a contig or the genome are rejected."""
+    genome = Genome(_contigs)
+
+    for contig, coordinate in (('chr1', 100), ('chr1', -1), ('chrM', 16)):
+        with pytest.raises(ValueError):
+            genome.to_global(contig, coordinate)
+    with pytest.raises(ValueError):
+        genome.to_global_batch(['chr2', 'chr1'], [3, 120])
+
+    for coordinate in (-5, 166, 500):
+        with pytest.raises(ValueError):
+            genome.to_local(coordinate)
+    with pytest.raises(ValueError):
+        genome.to_local_batch([5, -1])
+    with pytest.raises(ValueError):
+        genome.route([5, 166])
@@ -0,0 +1,54 @@
+from mutalyzer_crossmapper import Coding, NonCoding, join
+
+_exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
+_cds = (32, 43)
+
+_crossmaps = [
+    Coding(_exons, _cds),
+    NonCoding([(10, 20)], True),
+    Coding([(15, 18), (25, 90)], (16, 30), True),
+    NonCoding([(100, 110)])]
+
+
+def _brute_force(coordinates, flank):
+    result = []
+
+    for coordinate in coordinates:
+        for crossmap in _crossmaps:
+            if (crossmap._locations[0][0] - flank <= coordinate <
+                    crossmap._locations[-1][1] + flank):
+                if isinstance(crossmap, Coding):
+                    position = crossmap.coordinate_to_coding(coordinate)
+                else:
+                    position = crossmap.coordinate_to_noncoding(coordinate)
+                result.append((coordinate, crossmap, position))
+
+    return result
+
+
+def test_join():
+    """Join of coordinates and transcripts."""
+    coordinates = [0, 5, 9, 10, 10, 19, 20, 60, 95, 99, 105, 120]
+
+    assert list(join(coordinates, _crossmaps)) == _brute_force(
+        coordinates, 0)
+
+
+def test_join_flank():
+    """Join of coordinates and transcripts with flanking regions."""
+    coordinates = [0, 5, 9, 10, 10, 19, 20, 60, 95, 99, 105, 114, 115]
+
+    assert list(join(coordinates, _crossmaps, 5)) == _brute_force(
+        coordinates, 5)
+
+
+def test_join_stream():
+    """Join of streamed inputs."""
+    assert list(join(iter(range(120)), iter(_crossmaps), 3)) == (
+        _brute_force(range(120), 3))
+
+
+def test_join_empty():
+    """Join with empty inputs."""
+    assert list(join([], _crossmaps)) == []
+    assert list(join(range(10), [])) == []
@@ -1,3 +1,5 @@
+from pickle import dumps, loads
+
 from mutalyzer_crossmapper import Locus
 
 from helper import degenerate_equal, invariant
@@ -41,3 +43,11 @@ def test_Locus_inverted_degenerate():
 
     degenerate_equal(locus.to_coordinate, 20, [(0, -1), (-1, 0)])
     degenerate_equal(locus.to_coordinate, 9, [(9, 1), (10, 0)])
+
+
+def test_Locus_pickle():
+    """Pickled Locus."""
+    locus = loads(dumps(Locus((30, 35), True)))
+
+    assert locus.boundary == (30, 34)
+    assert locus.to_position(31) == (3, 0)
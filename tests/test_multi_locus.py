@@ -1,5 +1,11 @@
+from array import array
+from pickle import dumps, loads
+
+import pytest
+
 from mutalyzer_crossmapper import MultiLocus
-from mutalyzer_crossmapper.multi_locus import _offsets
+from mutalyzer_crossmapper.multi_locus import (
+    _interned, _offsets, _pack, _unpack, interned)
 
 from helper import degenerate_equal, invariant
 
@@ -166,3 +172,172 @@ def test_MultiLocus_inverted_degenerate():
         multi_locus.to_coordinate, 72, [(0, -1, -1), (-1, 0, -1)])
     degenerate_equal(
         multi_locus.to_coordinate, 4, [(21, 1, 1), (22, 0, 1)])
+
+
+def test_MultiLocus_dense():
+    """Dense lookup table."""
+    for locations in (_locations, [(1, 3), (3, 5)], [(10, 11), (12, 13)]):
+        for inverted in (False, True):
+            multi_locus = MultiLocus(locations, inverted)
+            dense = MultiLocus(locations, inverted, 1024)
+
+            assert dense._table
+            for coordinate in range(80):
+                position = dense.to_position(coordinate)
+                assert position == multi_locus.to_position(coordinate)
+                assert dense.to_coordinate(position) == coordinate
+
+
+def test_MultiLocus_dense_ceiling():
+    """No dense lookup table when the memory ceiling is exceeded."""
+    assert not MultiLocus(_locations, dense=535)._table
+    assert MultiLocus(_locations, dense=536)._table
+
+
+def test_MultiLocus_to_position_into():
+    """Conversion into output buffers."""
+    coordinates = array('l', range(80))
+
+    for dense in (0, 1024):
+        for inverted in (False, True):
+            multi_locus = MultiLocus(_locations, inverted, dense)
+            positions = array('l', [0] * 80)
+            offsets = array('l', [0] * 80)
+            outsides = array('l', [0] * 80)
+
+            multi_locus.to_position_into(
+                coordinates, positions, memoryview(offsets), outsides)
+            assert list(zip(positions, offsets, outsides)) == list(
+                map(multi_locus.to_position, coordinates))
+
+
+def test_MultiLocus_intersection():
+    """Intersection of a location with the loci."""
+    multi_locus = MultiLocus(_locations)
+
+    assert multi_locus.intersection((6, 42)) == [
+        (6, 8), (14, 20), (30, 35), (40, 42)]
+    assert multi_locus.intersection((0, 100)) == _locations
+    assert multi_locus.intersection((31, 33)) == [(31, 33)]
+    assert multi_locus.intersection((36, 38)) == []
+
+
+def test_interned():
+    """Shared MultiLocus objects."""
+    multi_locus = interned(_locations)
+
+    assert interned(list(map(list, _locations))) is multi_locus
+    assert interned(_locations, True) is not multi_locus
+    assert interned(_locations, dense=1024) is not multi_locus
+
+
+def test_interned_discarded():
+    """Shared MultiLocus objects are discarded when no longer in use."""
+    multi_locus = interned([(1, 2)])
+    size = len(_interned)
+
+    del multi_locus
+    assert len(_interned) == size - 1
+
+
+def test_MultiLocus_to_position_runs():
+    """Runs of positions."""
+    multi_locus = MultiLocus(_locations)
+
+    assert multi_locus.to_position_runs((2, 16)) == [
+        (2, 3, (0, -3, -3)), (5, 3, (0, 0, 0)), (8, 3, (2, 1, 0)),
+        (11, 3, (3, -3, 0)), (14, 2, (3, 0, 0))]
+    assert multi_locus.to_position_runs((36, 37)) == [(36, 1, (13, 2, 0))]
+    assert multi_locus.to_position_runs((36, 36)) == []
+
+
+def test_MultiLocus_to_position_runs_expand():
+    """Expanded runs of positions equal converted positions."""
+    for locations in (_locations, [(1, 3), (3, 5)], [(10, 11), (12, 13)]):
+        for inverted in (False, True):
+            multi_locus = MultiLocus(locations, inverted)
+            step = multi_locus._orientation
+
+            positions = []
+            for coordinate, size, pos in multi_locus.to_position_runs(
+                    (0, 80)):
+                for i in range(size):
+                    if pos[1]:
+                        positions.append((
+                            pos[0], pos[1] + step * i,
+                            pos[2] and pos[2] + step * i))
+                    else:
+                        positions.append((pos[0] + step * i, 0, 0))
+
+            assert positions == list(map(multi_locus.to_position, range(80)))
+
+
+def test_MultiLocus_len():
+    """Total length of the loci."""
+    assert len(MultiLocus(_locations)) == 22
+
+
+def test_MultiLocus_to_position_sorted():
+    """Sweep over sorted coordinates."""
+    for locations in (_locations, [(1, 3), (3, 5)], [(10, 11), (12, 13)]):
+        for inverted in (False, True):
+            multi_locus = MultiLocus(locations, inverted)
+
+            assert multi_locus.to_position_sorted(range(80)) == list(
+                map(multi_locus.to_position, range(80)))
+
+
+def test_pack():
+    """Packed locations."""
+    assert _pack(_locations) == (5, 3, 6, 6, 10, 5, 5, 4, 6, 2, 18, 2)
+    assert _unpack(list, _pack(_locations)) == _locations
+
+
+def test_MultiLocus_pickle():
+    """Pickled MultiLocus."""
+    for dense in (0, 1024):
+        multi_locus = MultiLocus(_locations, True, dense)
+        copy = loads(dumps(multi_locus))
+
+        assert bool(copy._table) == bool(dense)
+        assert list(map(copy.to_position, range(80))) == list(
+            map(multi_locus.to_position, range(80)))
+
+
+def test_MultiLocus_strategy():
+    """Choice of conversion strategy."""
+    multi_locus = MultiLocus(_locations)
+
+    assert multi_locus.strategy([10]) == 'bisect'
+    assert multi_locus.strategy([10, 12]) == 'sweep'
+    assert multi_locus.strategy([12, 10]) == 'sort'
+    assert MultiLocus(_locations, dense=1024).strategy([12, 10]) == 'dense'
+
+
+def test_MultiLocus_to_position_batch():
+    """Batch conversion with all strategies."""
+    coordinates = list(range(80)) + list(range(80, 0, -3))
+
+    for inverted in (False, True):
+        multi_locus = MultiLocus(_locations, inverted)
+        expected = list(map(multi_locus.to_position, coordinates))
+
+        assert multi_locus.to_position_batch(coordinates) == expected
+        for strategy in ('bisect', 'sort'):
+            assert multi_locus.to_position_batch(
+                coordinates, strategy) == expected
+        assert MultiLocus(_locations, inverted, 1024).to_position_batch(
+            coordinates, 'dense') == expected
+        assert multi_locus.to_position_batch(
+            sorted(coordinates), 'sweep') == list(
+                map(multi_locus.to_position, sorted(coordinates)))
+        assert multi_locus.to_position_batch(
+            coordinates, 'sweep') == expected
+
+
+def test_MultiLocus_to_position_batch_unknown():
+    """Unknown or unavailable conversion strategy."""
+    with pytest.raises(ValueError):
+        MultiLocus(_locations).to_position_batch([10, 12], 'bogus')
+    with pytest.raises(ValueError):
+        MultiLocus(_locations).to_position_batch([10, 12], 'dense')
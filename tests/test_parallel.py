@@ -0,0 +1,47 @@
+from functools import partial
+
+from mutalyzer_crossmapper import Coding, thread_map
+from mutalyzer_crossmapper.parallel import _chunks
+
+_exons = [(5, 8), (14, 20), (30, 35), (40, 44), (50, 52), (70, 72)]
+_cds = (32, 43)
+
+
+def test_chunks():
+    """Contiguous chunks of nearly equal size."""
+    assert _chunks(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert _chunks(2, 4) == [(0, 1), (1, 2)]
+    assert _chunks(0, 4) == []
+
+
+def test_thread_map():
+    """Parallel conversion equals sequential conversion."""
+    crossmap = Coding(_exons, _cds, True)
+    coordinates = list(range(100))
+
+    for workers in (1, 2, 3, 8, 200):
+        assert thread_map(
+            crossmap.coordinate_to_coding, coordinates,
+            workers=workers) == list(
+                map(crossmap.coordinate_to_coding, coordinates))
+
+
+def test_thread_map_arguments():
+    """Parallel conversion with multiple and fixed arguments."""
+    crossmap = Coding(_exons, _cds)
+    coordinates = list(range(100))
+
+    assert thread_map(
+        partial(crossmap.coordinate_to_coding, degenerate=True), coordinates,
+        workers=4) == [
+            crossmap.coordinate_to_coding(coordinate, True)
+            for coordinate in coordinates]
+    assert thread_map(
+        lambda transcript, coordinate: transcript.coordinate_to_coding(
+            coordinate), [crossmap] * 100, coordinates, workers=4) == list(
+                map(crossmap.coordinate_to_coding, coordinates))
+
+
+def test_thread_map_empty():
+    """Parallel conversion of an empty sequence."""
+    assert thread_map(Coding(_exons, _cds).coordinate_to_coding, []) == []